@@ -1,22 +1,41 @@
-from manim import *
+from __future__ import annotations
+
+from manim import (
+    RED, TAU, UL, WHITE,
+    Dot, Line, Variable, VGroup, VMobject,
+    Create, Uncreate,
+    Scene,
+    rate_functions,
+)
 import numpy as np
-from numpy.typing import NDArray
-from bezier import Curve as BezierCurve
 import random
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+sys.path.append ( str ( Path ( __file__ ).resolve ( ).parent.parent ) )
+
+from common.curves import adaptive_curve
+from common.layers import StaticLayerScene
 
 arr = np.array
 
 random.seed ( 114514 )
 
-def calcPoints ( t: float, points: NDArray, result: NDArray | None = None ):
-    numPoints, dimension = points.shape
-    if result is None: 
-        result = np.empty ( ( numPoints - 1, dimension ) )
-    start, end = None, points [ 0 ]
-    for i in range ( numPoints - 1 ):
-        start, end = end, points [ i + 1 ]
-        result [ i ] = start * ( 1 - t ) + end * t
-    return result
+def deCasteljau ( t, points: NDArray ) -> list [ NDArray ]:
+    # computes the whole de Casteljau triangle of the curve with control points `points`
+    # `t` can be a scalar or an array; level `i` of the result has shape 
+    # `np.shape ( t ) + ( len ( points ) - i, dimension )`, and the last level holds the curve point
+    t = np.asarray ( t, dtype = float ) [ ..., np.newaxis, np.newaxis ]
+    level = np.broadcast_to ( points, t.shape [ :-2 ] + points.shape )
+    levels = [ level ]
+    for _ in range ( len ( points ) - 1 ):
+        level = level [ ..., :-1, : ] * ( 1 - t ) + level [ ..., 1:, : ] * t
+        levels.append ( level )
+    return levels
 
 def randomTurbulence ( max_radius ):
     radius = random.random ( ) * max_radius
@@ -26,16 +45,6 @@ def randomTurbulence ( max_radius ):
         radius * np.sin ( angle ), 0 
     ) )
 
-# make `BezierCurve` objects callable
-# the return result is a 1d array representing a point on the curve at position `t`
-BezierCurve.__call__ = lambda self, t: self.evaluate ( t ).transpose ( ) [ 0 ]
-
-def makeCurve ( controlPoints: NDArray ):
-    return BezierCurve ( 
-        controlPoints.transpose ( ),
-        len ( controlPoints ) - 1,
-    )
-
 def createControlPointsMob ( controlPoints ):
     mob_controlPoints = VGroup ( )
     mob_polyline = VGroup ( )
@@ -46,7 +55,50 @@ def createControlPointsMob ( controlPoints ):
         mob_polyline.add ( Line ( start, end ).set_stroke ( opacity = 0.75 ) )
     return mob_controlPoints, mob_polyline
 
-class BezierScene ( Scene ):
+# positions of the 4 points of a straight cubic Bézier segment, relative to its start and end
+_segmentWeights = np.linspace ( 0, 1, 4 ) [ :, np.newaxis ]
+
+class DeCasteljauConstruction ( VGroup ):
+    # the intermediate levels of the de Casteljau triangle ( excluding the control points and the curve point )
+    # all points of a level are drawn by one mobject and all its segments by another,
+    # so that updating the construction takes one array write per mobject
+    def __init__ ( 
+            self, 
+            controlPoints: NDArray, 
+            t: float = 0, 
+            dotRadius: float = 0.06, 
+            lineOpacity: float = 0.5, 
+            **kwargs
+    ):
+        super ( ).__init__ ( **kwargs )
+        self.controlPoints = np.asarray ( controlPoints, dtype = float )
+        numLevels = len ( controlPoints ) - 2
+        self.__dotShape = Dot ( radius = dotRadius ).points
+        self.levelLines = VGroup ( *( 
+            VMobject ( ).set_stroke ( WHITE, opacity = lineOpacity ) 
+            for _ in range ( numLevels ) 
+        ) )
+        self.levelDots = VGroup ( *( 
+            VMobject ( ).set_fill ( WHITE, opacity = 1 ).set_stroke ( width = 0 ) 
+            for _ in range ( numLevels ) 
+        ) )
+        self.add ( self.levelLines, self.levelDots )
+        self.setT ( t )
+
+    def setT ( self, t: float ):
+        self.levels = deCasteljau ( t, self.controlPoints )
+        for points, dots, lines in zip ( self.levels [ 1:-1 ], self.levelDots, self.levelLines ):
+            dots.points = ( points [ :, np.newaxis ] + self.__dotShape ).reshape ( -1, 3 )
+            starts, ends = points [ :-1, np.newaxis ], points [ 1:, np.newaxis ]
+            lines.points = ( starts + _segmentWeights * ( ends - starts ) ).reshape ( -1, 3 )
+        return self
+
+    def getLevel ( self, i: int ) -> tuple [ VMobject, VMobject ]:
+        # the points and the segments of level `i`, counting the control points as level 0
+        # style them with `set_fill` / `set_stroke` as usual
+        return self.levelDots [ i - 1 ], self.levelLines [ i - 1 ]
+
+class BezierScene ( StaticLayerScene, Scene ):
     def construct ( self ):
         controlPoints = np.array ( ( 
             ( -4, -2, 0 ), 
@@ -54,62 +106,32 @@ class BezierScene ( Scene ):
             ( 2, 2, 0 ), 
             ( 5, -2, 0 ),
         ) )
-        curve_degree = len ( controlPoints ) - 1
-        
+        # curve_degree = len ( controlPoints ) - 1
         # max_turb_radius = 0.05
         # add random turbulence to the points
         # for i in range ( curve_degree ):
         #     controlPoints [ i ] = controlPoints [ i ] + randomTurbulence ( max_turb_radius )
 
-        curve = makeCurve ( controlPoints )
         animate_config = {
             "run_time": 5,
             "rate_func": rate_functions.ease_in_out_quad
         }
 
-        auxControlPoints = [ controlPoints ]
-        for i in range ( curve_degree ):
-            auxControlPoints.append ( np.empty ( ( curve_degree - i, 3 ) ) )
-
-        mob_curve = ParametricFunction ( curve, color = RED )
+        mob_curve = adaptive_curve ( 
+            lambda t: deCasteljau ( t, controlPoints ) [ -1 ] [ :, 0 ],
+            color = RED,
+        )
         mob_controlPoints, mob_polyline = createControlPointsMob ( controlPoints )
         mob_t_text = Variable ( 0, "t" ).to_corner ( UL )
         mob_t = mob_t_text.tracker
         mob_trace_point = Dot ( )
+        mob_construction = DeCasteljauConstruction ( controlPoints )
 
-        def updater ( _ ):
-            for i in range ( curve_degree ):
-                t = mob_t.get_value ( )
-                auxControlPoints [ i + 1 ] = calcPoints ( 
-                    t, auxControlPoints [ i ], 
-                    auxControlPoints [ i + 1 ] 
-                )
-        
-        def getPointUpdater ( i, j ):
-            return lambda mob: mob.move_to ( 
-                auxControlPoints [ i + 1 ] [ j ] 
-            ) 
-        
-        def getLineUpdater ( i, j ):
-            return lambda mob: mob.put_start_and_end_on (
-                auxControlPoints [ i + 1 ] [ j ], 
-                auxControlPoints [ i + 1 ] [ j + 1 ]  
-            )
-
-        for i in range ( curve_degree - 1 ): 
-            for j in range ( curve_degree - i ):
-                mob_point = Dot ( radius = 0.06 )
-                mob_point.add_updater ( getPointUpdater ( i, j ) )
-                self.add ( mob_point )
-            for j in range ( curve_degree - i - 1 ):
-                mob_line = Line ( ).set_stroke ( opacity = 0.5 )
-                mob_line.add_updater ( getLineUpdater ( i, j ) )
-                self.add ( mob_line )
-        
-        mob_trace_point.add_updater ( lambda mob: mob.move_to ( curve ( mob_t.get_value ( ) ) ) )
-        mob_t.add_updater ( updater )
+        mob_construction.add_updater ( lambda mob: mob.setT ( mob_t.get_value ( ) ) )
+        mob_trace_point.add_updater ( lambda mob: mob.move_to ( mob_construction.levels [ -1 ] [ 0 ] ) )
         
-        self.add ( mob_t_text, mob_controlPoints, mob_polyline, mob_trace_point )
+        # the still control points and polyline come first, so they are drawn once into the background
+        self.add ( mob_controlPoints, mob_polyline, mob_construction, mob_t_text, mob_trace_point )
         self.play ( 
             mob_t.animate ( **animate_config ).set_value ( 1 ),
             Create ( mob_curve, **animate_config ) 
@@ -1,11 +1,26 @@
-from manim import *
-from manim.camera.camera import Camera
-from manim.utils.rate_functions import ease_in_out_quad
+from manim import (
+    BLUE, GREEN, IN, ORIGIN, OUT, PI, RED, TAU, WHITE, YELLOW,
+    Arrow, Circle, Dot, LabeledLine, Line, MathTex, Point, PolarPlane, Tex, ValueTracker, VGroup, VMobject,
+    Create, FadeIn, FadeOut, Flash, Indicate, Rotating, Transform, Uncreate, Write,
+    Scene, ThreeDScene,
+    normalize, rate_functions, smooth,
+)
 import numpy as np
 
-from functools import lru_cache
+import sys
+from pathlib import Path
 from typing import Callable
 
+sys.path.append ( str ( Path ( __file__ ).resolve ( ).parent.parent ) )
+
+from common.grid import merge_by_style
+from common.layers import StaticLayerScene
+from common.projection import ProjectiveThreeDCamera
+from common.readout import DecimalReadout
+from common.redraw import line_in_place
+from common.timeline import ThetaTimeline
+import trochoid
+
 FONT = "Ysabeau Office"
 
 def arr ( *numbers ):
@@ -13,37 +28,13 @@ def arr ( *numbers ):
     array.setflags ( write = False )
     return array
 
-def normal_vector ( line ):
-    return line.copy ( ).rotate ( PI / 2 ).get_unit_vector ( )
-
-@lru_cache
-def circular ( t, r ) -> tuple:
-    return arr (
-        r * np.cos ( t ),
-        r * np.sin ( t ),
-        0,
-    )
-
-@lru_cache
-def cycloid_on_circle ( t: float, r1: float, r2: float ) -> tuple [ float, float, float ]:
-    r0, k = r1 + r2, r1 / r2
-    return arr (
-        np.cos ( t ) * r0 - np.cos ( ( k + 1 ) * t ) * r2,
-        np.sin ( t ) * r0 - np.sin ( ( k + 1 ) * t ) * r2,
-        0,
-    )
-
-@lru_cache
-def cycloid_on_line ( t, r1, r2 ):
-    k = r1 / r2
-    return arr (
-        ( t - PI ) * r1 - np.sin ( k * t ) * r2,
-        -np.cos ( k * t ) * r2,
-        0
-    )
-
-
-class CircleRotationScene ( Scene ):
+def trochoid_locus ( rolling: trochoid.RollingCircle, **kwargs ) -> VMobject:
+    # the locus as an exact cubic Bézier path, see `trochoid.cycloid_on_circle_bezier`
+    points, _ = rolling.bezier ( )
+    return VMobject ( fill_opacity = 0, **kwargs ).set_points ( points )
+
+
+class CircleRotationScene ( StaticLayerScene, Scene ):
     def __init__ ( 
             self, 
             show_prompt: bool = True,
@@ -68,7 +59,8 @@ class CircleRotationScene ( Scene ):
         r1 = self.__r1
         r2 = self.__r2
         r3 = self.__r3
-        k = r1 / r2
+        on_circle = trochoid.RollingCircle ( r1, r2 )
+        on_line = trochoid.RollingCircle ( r1, r2, on_line = True )
 
         line_extent = self.__line_extent
         easing = self.__easing
@@ -102,25 +94,13 @@ class CircleRotationScene ( Scene ):
             .set_stroke ( opacity = 0.5 )
         locus_line = Line ( locus_line_start, locus_line_end ) \
             .set_stroke ( opacity = 0.5 )
-        locus_cycloid_on_circle = ParametricFunction (
-            lambda t: cycloid_on_circle ( t, r1, r2 ),
-            t_range = ( 0, TAU ),
-            fill_opacity = 0
-        ).set_color ( RED )
-        locus_cycloid_on_line = ParametricFunction (
-            lambda t: cycloid_on_line ( t, r1, r2 ),
-            t_range = ( 0, TAU ),
-            fill_opacity = 0,
-        ).set_color ( RED )
+        locus_cycloid_on_circle = trochoid_locus ( on_circle ).set_color ( RED )
+        locus_cycloid_on_line = trochoid_locus ( on_line ).set_color ( RED )
 
         theta = ValueTracker ( )
+        timeline = ThetaTimeline ( theta )
 
-        circle2_radius = always_redraw (
-            lambda: Line ( 
-                circular ( theta.get_value ( ), r1 + r2 ),
-                cycloid_on_circle ( theta.get_value ( ), r1, r2 ),
-            )
-        )
+        circle2_radius = line_in_place ( lambda: timeline.lookup ( on_circle.radius ) )
 
         if show_prompt:
             circle3 = Circle ( r3, color = WHITE ).to_corner ( )
@@ -134,15 +114,15 @@ class CircleRotationScene ( Scene ):
                 color = WHITE,
             )
             circle3_radius_initial = circle3_radius.copy ( ).set_stroke ( opacity = 0.5 )
-            turns_text = DecimalNumber (
+            turns_text = DecimalReadout (
                 0,
                 unit = r"\text{turns}",
                 num_decimal_places = 2,
                 unit_buff_per_font_unit = 0.003,
             ).next_to ( circle3, buff = 0.25 )
 
-            circle_turns_updater = lambda mob: mob.set_value ( theta.get_value ( ) * abs ( k + 1 ) / TAU )
-            line_turns_updater = lambda mob: mob.set_value ( theta.get_value ( ) * abs ( k ) / TAU )
+            circle_turns_updater = lambda mob: mob.set_value ( timeline.lookup ( on_circle.turns ) )
+            line_turns_updater = lambda mob: mob.set_value ( timeline.lookup ( on_line.turns ) )
 
         self.play ( 
             Create ( 
@@ -167,14 +147,15 @@ class CircleRotationScene ( Scene ):
             self.add ( circle3_radius_initial )
             turns_text.add_updater ( circle_turns_updater )
 
-        trace_dot_updater = lambda mob: mob.move_to ( cycloid_on_circle ( theta.get_value ( ), r1, r2 ) )
+        trace_dot_updater = lambda mob: mob.move_to ( timeline.lookup ( on_circle.traced ) )
         trace_dot.add_updater ( trace_dot_updater )
 
         tempList = [
-            theta.animate ( 
+            timeline.animate ( 
+                TAU,
                 run_time = animate_time,
                 rate_func = easing,
-            ).set_value ( TAU ),
+            ),
             * ( Create (
                 mob,
                 run_time = animate_time,
@@ -195,7 +176,7 @@ class CircleRotationScene ( Scene ):
                     circle3_radius,
                     axis = IN if r2 < 0 else OUT,
                     about_point = circle3_center,
-                    radians = abs ( k + 1 ) * TAU,
+                    radians = on_circle.turns_per_revolution * TAU,
                     run_time = animate_time,
                     rate_func = easing,
                 ),
@@ -225,7 +206,7 @@ class CircleRotationScene ( Scene ):
             Transform (
                 circle1, line1,
             ),
-            theta.animate.set_value ( 0 ),
+            timeline.animate ( 0 ),
             circle2.animate.move_to ( locus_line_start ),
             circle2_center_dot.animate.move_to ( locus_line_start ),
             run_time = 0.75,
@@ -240,12 +221,7 @@ class CircleRotationScene ( Scene ):
                     circle3_v
                 )
 
-        circle2_radius = always_redraw (
-            lambda: Line (
-                ( ( -PI + theta.get_value ( ) ) * r1, 0, 0 ),
-                cycloid_on_line ( theta.get_value ( ), r1, r2 ),
-            )
-        )
+        circle2_radius = line_in_place ( lambda: timeline.lookup ( on_line.radius ) )
 
         tempList = [ circle2_radius ]
         if show_prompt: tempList.append ( circle3_radius )
@@ -263,14 +239,15 @@ class CircleRotationScene ( Scene ):
             turns_text.remove_updater ( circle_turns_updater )
             turns_text.add_updater ( line_turns_updater )
         
-        trace_dot_updater = lambda mob: mob.move_to ( cycloid_on_line ( theta.get_value ( ), r1, r2 ) )
+        trace_dot_updater = lambda mob: mob.move_to ( timeline.lookup ( on_line.traced ) )
         trace_dot.add_updater ( trace_dot_updater )
 
         tempList = [
-            theta.animate (
+            timeline.animate (
+                TAU,
                 rate_func = easing,
                 run_time = animate_time,
-            ).set_value ( TAU ),
+            ),
             *( mob.animate ( 
                 rate_func = easing,
                 run_time = animate_time,
@@ -291,7 +268,7 @@ class CircleRotationScene ( Scene ):
                 Rotating (
                     circle3_radius,
                     about_point = circle3_center,
-                    radians = abs ( k ) * TAU,
+                    radians = on_line.turns_per_revolution * TAU,
                     axis = IN if r2 > 0 else OUT,
                     rate_func = easing, 
                     run_time = animate_time,
@@ -314,7 +291,7 @@ class CircleRotationScene_Internal ( CircleRotationScene ):
     def __init__ ( self ):
         super().__init__ ( r2 = -2 / 3 )
 
-class CircleRotationScene_3D ( ThreeDScene ):
+class CircleRotationScene_3D ( StaticLayerScene, ThreeDScene ):
     def __init__ (
             self,
             r1: float = 2,
@@ -325,7 +302,7 @@ class CircleRotationScene_3D ( ThreeDScene ):
             create_easing: Callable [ [ float ], float ] = rate_functions.ease_in_out_quad,
             uncreate_easing: Callable [ [ float ], float ] = smooth,
     ):
-        super ( ).__init__ ( )
+        super ( ).__init__ ( camera_class = ProjectiveThreeDCamera )
         self.__r1 = r1
         self.__r2 = r2
         self.__r3 = r3
@@ -336,12 +313,14 @@ class CircleRotationScene_3D ( ThreeDScene ):
 
     def construct ( self ):
         r1, r2 = self.__r1, self.__r2
+        outer = trochoid.RollingCircle ( r1, r2 )
+        inner = trochoid.RollingCircle ( r1, -r2 )
         create_animate_time = self.__create_animate_time
         uncreate_animate_time = self.__uncreate_animate_time
         create_easing = self.__create_easing
         uncreate_easing = self.__uncreate_easing
 
-        grid = PolarPlane ( ).set_stroke ( opacity = 0.5, color = WHITE )
+        grid = merge_by_style ( PolarPlane ( ).set_stroke ( opacity = 0.5, color = WHITE ) )
 
         circle2_left = arr ( r1, 0, 0 )
         circle2_center = arr ( r1 + r2, 0, 0 )
@@ -360,19 +339,12 @@ class CircleRotationScene_3D ( ThreeDScene ):
         )
 
         theta = ValueTracker ( 0 )
+        timeline = ThetaTimeline ( theta )
 
         circle2_radius = Line ( circle2_center, circle2_left )
 
-        locus_cycloid_on_circle_outer = ParametricFunction (
-            lambda t: cycloid_on_circle ( t, r1, r2 ),
-            t_range = ( 0, TAU ),
-            fill_opacity = 0
-        ).set_color ( RED )
-        locus_cycloid_on_circle_inner = ParametricFunction (
-            lambda t: cycloid_on_circle ( t, r1, -r2 ),
-            t_range = ( 0, TAU ),
-            fill_opacity = 0
-        ).set_color ( RED )
+        locus_cycloid_on_circle_outer = trochoid_locus ( outer ).set_color ( RED )
+        locus_cycloid_on_circle_inner = trochoid_locus ( inner ).set_color ( RED )
 
         self.play ( 
             Create ( circle1 ), 
@@ -406,18 +378,15 @@ class CircleRotationScene_3D ( ThreeDScene ):
             run_time = 0.25,
         )
 
-        trace_dot_updater = lambda mob: mob.move_to ( 
-            cycloid_on_circle ( theta.get_value ( ), r1, r2 ) 
-        )
+        trace_dot_updater = lambda mob: mob.move_to ( timeline.lookup ( outer.traced ) )
         circle2_radius_updater = lambda mob: mob.put_start_and_end_on (
-            circular ( theta.get_value ( ), r1 + r2 ),
-            cycloid_on_circle ( theta.get_value ( ), r1, r2 )
+            *timeline.lookup ( outer.radius )
         )
         trace_dot.add_updater ( trace_dot_updater )
         circle2_radius.add_updater ( circle2_radius_updater )
 
         self.play (
-            theta.animate.set_value ( TAU ),
+            timeline.animate ( TAU ),
             self.camera.theta_tracker.animate.increment_value ( TAU ),
             self.camera.phi_tracker.animate.set_value ( PI / 5 ),
             Rotating ( circle2_group, about_point = ORIGIN ),
@@ -434,7 +403,7 @@ class CircleRotationScene_3D ( ThreeDScene ):
             run_time = 0.25,
         )
         self.play (
-            theta.animate.set_value ( 0 ),
+            timeline.animate ( 0 ),
             self.camera.theta_tracker.animate.increment_value ( PI / 6 ),
             self.camera.phi_tracker.animate.set_value ( PI / 4 ),
             Rotating (
@@ -474,12 +443,9 @@ class CircleRotationScene_3D ( ThreeDScene ):
             run_time = 0.25 
         )
 
-        trace_dot_updater = lambda mob: mob.move_to ( 
-            cycloid_on_circle ( theta.get_value ( ), r1, -r2 ) 
-        )
+        trace_dot_updater = lambda mob: mob.move_to ( timeline.lookup ( inner.traced ) )
         circle2_radius_updater = lambda mob: mob.put_start_and_end_on (
-            circular ( theta.get_value ( ), r1 - r2 ),
-            cycloid_on_circle ( theta.get_value ( ), r1, -r2 )
+            *timeline.lookup ( inner.radius )
         )
         trace_dot.add_updater ( trace_dot_updater )
         circle2_radius.add_updater ( circle2_radius_updater )
@@ -488,7 +454,7 @@ class CircleRotationScene_3D ( ThreeDScene ):
         )
 
         self.play (
-            theta.animate.set_value ( TAU ),
+            timeline.animate ( TAU ),
             self.camera.theta_tracker.animate.increment_value ( TAU ),
             self.camera.phi_tracker.animate.set_value ( PI / 5 ),
             Rotating ( circle2_group, about_point = ORIGIN ),
@@ -500,7 +466,7 @@ class CircleRotationScene_3D ( ThreeDScene ):
 
         self.wait ( 3 )
 
-class CircleRotationScene_Analysis ( Scene ):
+class CircleRotationScene_Analysis ( StaticLayerScene, Scene ):
     def __init__ ( 
             self,
             r1: float = 1.6,
@@ -524,6 +490,7 @@ class CircleRotationScene_Analysis ( Scene ):
         r1 = self.__r1
         r2 = self.__r2
         theta0 = self.__theta0
+        rolling = trochoid.RollingCircle ( r1, r2 )
         create_animate_time = self.__create_animate_time
         uncreate_animate_time = self.__uncreate_animate_time
         create_easing = self.__create_easing
@@ -532,8 +499,8 @@ class CircleRotationScene_Analysis ( Scene ):
         circle1_center = arr ( -3.2, 0, 0 )
         circle2_left = circle1_center + ( r1, 0, 0 )
         circle2_center = circle2_left + ( r2, 0, 0 )
-        circle2_center_final = circular ( theta0, r1 + r2 ) + circle1_center
-        tangent_point_final = circular ( theta0, r1 ) + circle1_center
+        circle2_center_final = rolling.center ( theta0 ) + circle1_center
+        tangent_point_final = rolling.contact ( theta0 ) + circle1_center
 
         circle1 = Circle ( r1, color = WHITE ).move_to ( circle1_center )
         circle2 = Circle ( r2, color = WHITE ).move_to ( circle2_center )
@@ -546,14 +513,11 @@ class CircleRotationScene_Analysis ( Scene ):
         circle2_radius = Line ( circle2_center, circle2_left )
         circle2_group = VGroup ( circle2, circle2_center_dot )
 
-        locus_cycloid_on_circle = ParametricFunction (
-            lambda t: cycloid_on_circle ( t, r1, r2 ) + circle1_center,
-            t_range = ( 0, TAU ),
-            fill_opacity = 0
-        ).set_color ( RED )
+        locus_cycloid_on_circle = trochoid_locus ( rolling ).shift ( circle1_center ).set_color ( RED )
         locus_circle = Circle ( r1 + r2, color = WHITE ).move_to ( circle1_center ).set_stroke ( opacity = 0.5 )
 
         theta_value = ValueTracker ( 0 )
+        timeline = ThetaTimeline ( theta_value )
 
         self.play (
             Create ( circle1 ),
@@ -571,19 +535,18 @@ class CircleRotationScene_Analysis ( Scene ):
             run_time = 0.25,
         )
 
+        trace = lambda t: rolling.traced ( t ) + circle1_center
+        radius = lambda t: rolling.radius ( t ) + circle1_center
         circle2_radius_updater = lambda mob: mob.put_start_and_end_on (
-            circular ( theta := theta_value.get_value ( ), r1 + r2 ) + circle1_center,
-            cycloid_on_circle ( theta, r1, r2 ) + circle1_center,
-        )
-        trace_dot_updater = lambda mob: mob.move_to (
-            cycloid_on_circle ( theta_value.get_value ( ), r1, r2 ) + circle1_center,
+            *timeline.lookup ( radius )
         )
+        trace_dot_updater = lambda mob: mob.move_to ( timeline.lookup ( trace ) )
 
         circle2_radius.add_updater ( circle2_radius_updater )
         trace_dot.add_updater ( trace_dot_updater )
 
         self.play (
-            theta_value.animate.set_value ( TAU ),
+            timeline.animate ( TAU ),
             Rotating ( circle2_group, about_point = circle1_center ),
             Create ( locus_cycloid_on_circle ),
             Create ( locus_circle ),
@@ -595,7 +558,7 @@ class CircleRotationScene_Analysis ( Scene ):
 
         turn_back = TAU - theta0
         self.play (
-            theta_value.animate.set_value ( theta0 ),
+            timeline.animate ( theta0 ),
             Rotating ( 
                 circle2_group, 
                 about_point = circle1_center, 
@@ -657,7 +620,7 @@ class CircleRotationScene_Analysis ( Scene ):
         )
 
         arrow_length = r2 + 1
-        v1_vec = normal_vector ( r2_line ) * arrow_length
+        v1_vec = -normalize ( rolling.center_velocity ( theta0 ) ) * arrow_length
         circle2_center_velocity_end = circle2_center_final - v1_vec
         tangent_point_velocity_end = tangent_point_final - v1_vec
         tangent_point_velocity_inverse_end = tangent_point_final + v1_vec
@@ -0,0 +1,147 @@
+import numpy as np
+
+# vectorized versions of the locus formulas used in `scene.py`
+# `t` can be a scalar or an array of shape ( N, ), 
+# the result is then an array of shape ( 3, ) or ( N, 3 ) respectively
+
+def _stack ( x, y ):
+    return np.stack ( ( x, y, np.zeros_like ( x ) ), axis = -1 )
+
+def circular ( t, r ):
+    t = np.asarray ( t, dtype = float )
+    return _stack ( r * np.cos ( t ), r * np.sin ( t ) )
+
+def cycloid_on_circle ( t, r1, r2 ):
+    t = np.asarray ( t, dtype = float )
+    r0, k = r1 + r2, r1 / r2
+    return _stack (
+        np.cos ( t ) * r0 - np.cos ( ( k + 1 ) * t ) * r2,
+        np.sin ( t ) * r0 - np.sin ( ( k + 1 ) * t ) * r2,
+    )
+
+def cycloid_on_line ( t, r1, r2 ):
+    t = np.asarray ( t, dtype = float )
+    k = r1 / r2
+    return _stack (
+        ( t - np.pi ) * r1 - np.sin ( k * t ) * r2,
+        -np.cos ( k * t ) * r2,
+    )
+
+def cycloid_on_circle_velocity ( t, r1, r2 ):
+    # derivative of `cycloid_on_circle` with respect to `t`
+    t = np.asarray ( t, dtype = float )
+    r0, k = r1 + r2, r1 / r2
+    return _stack (
+        -np.sin ( t ) * r0 + np.sin ( ( k + 1 ) * t ) * ( k + 1 ) * r2,
+        np.cos ( t ) * r0 - np.cos ( ( k + 1 ) * t ) * ( k + 1 ) * r2,
+    )
+
+def cycloid_on_line_velocity ( t, r1, r2 ):
+    # derivative of `cycloid_on_line` with respect to `t`
+    t = np.asarray ( t, dtype = float )
+    k = r1 / r2
+    return _stack (
+        r1 - np.cos ( k * t ) * k * r2,
+        np.sin ( k * t ) * k * r2,
+    )
+
+# exact cubic Bézier paths of the loci
+# between two knots `a`, `b` the curve is replaced by its cubic Hermite interpolant, whose control points are
+# f ( a ), f ( a ) + h / 3 * f' ( a ), f ( b ) - h / 3 * f' ( b ), f ( b ) with h = b - a
+# its distance from the curve is at most h ^ 4 / 384 * max | f'''' |, so with a bound M of | f'''' |
+# knots spaced at most ( 384 * tolerance / M ) ^ ( 1 / 4 ) apart keep the whole path within `tolerance`
+# the traced point stops at every cusp ( t = 2 pi j / k ), so cusps are always knots and stay sharp
+
+def hermite_bezier ( position, velocity, knots ):
+    # control points of the cubic segments between consecutive `knots`, in manim's layout
+    # ( 4 points per segment: anchor, handle, handle, anchor ), as an array of shape ( 4 * ( N - 1 ), 3 )
+    knots = np.asarray ( knots, dtype = float )
+    p, v = position ( knots ), velocity ( knots )
+    h = np.diff ( knots ) [ :, np.newaxis ] / 3
+    return np.stack ( ( p [ :-1 ], p [ :-1 ] + v [ :-1 ] * h, p [ 1: ] - v [ 1: ] * h, p [ 1: ] ), axis = 1 ).reshape ( -1, 3 )
+
+def _knots ( t_range, cusp_period, max_step ):
+    t_min, t_max = t_range
+    cusps = np.arange ( np.ceil ( t_min / cusp_period ), np.floor ( t_max / cusp_period ) + 1 ) * cusp_period \
+        if np.isfinite ( cusp_period ) else [ ]
+    breaks = np.unique ( np.clip ( np.concatenate ( ( [ t_min ], cusps, [ t_max ] ) ), t_min, t_max ) )
+    # equal steps in each piece between breaks, the fewest that satisfy `max_step`, so that the knots stay
+    # close to uniform in t and `Create` keeps up with the traced point even across a short last piece
+    return np.concatenate ( [ 
+        np.linspace ( a, b, ( int ( np.ceil ( ( b - a ) / max_step ) ) or 1 ) + 1 ) [ :-1 ]
+        for a, b in zip ( breaks [ :-1 ], breaks [ 1: ] ) 
+    ] + [ breaks [ -1: ] ] )
+
+def _trochoid_bezier ( position, velocity, t_range, cusp_period, bound, tolerance ):
+    knots = _knots ( t_range, cusp_period, ( 384 * tolerance / bound ) ** 0.25 if bound > 0 else np.inf )
+    error = np.diff ( knots ).max ( ) ** 4 / 384 * bound
+    return hermite_bezier ( position, velocity, knots ), error
+
+def cycloid_on_circle_bezier ( r1, r2, t_range = ( 0, 2 * np.pi ), tolerance = 0.004 ):
+    # returns the control points of the locus of `cycloid_on_circle` over `t_range`,
+    # and a bound of its distance from the exact curve, never above `tolerance`
+    k = r1 / r2
+    return _trochoid_bezier ( 
+        lambda t: cycloid_on_circle ( t, r1, r2 ), lambda t: cycloid_on_circle_velocity ( t, r1, r2 ),
+        t_range, 2 * np.pi / abs ( k ) if k else np.inf, abs ( r1 + r2 ) + abs ( r2 * ( k + 1 ) ** 4 ), tolerance,
+    )
+
+def cycloid_on_line_bezier ( r1, r2, t_range = ( 0, 2 * np.pi ), tolerance = 0.004 ):
+    # same as `cycloid_on_circle_bezier`, for the locus of `cycloid_on_line`
+    k = r1 / r2
+    return _trochoid_bezier ( 
+        lambda t: cycloid_on_line ( t, r1, r2 ), lambda t: cycloid_on_line_velocity ( t, r1, r2 ),
+        t_range, 2 * np.pi / abs ( k ) if k else np.inf, abs ( r2 * k ** 4 ), tolerance,
+    )
+
+class RollingCircle:
+    # kinematics of a circle of radius `r2` rolling without slipping, while its centre turns by `t` radians
+    # around a fixed circle of radius `r1` at the origin ( outside if `r2 > 0`, inside if `r2 < 0` ),
+    # or, with `on_line`, along the line y = -r2 over the same arc length, from x = -pi * r1 at `t = 0`
+    # the traced point starts on the fixed circle ( or line ), and every method takes a scalar `t` or an array
+    # of shape ( N, ) and returns one point or vector per `t`, like the functions above
+    def __init__ ( self, r1: float, r2: float, on_line: bool = False ):
+        self.r1, self.r2, self.on_line = r1, r2, on_line
+        self.k = r1 / r2
+
+    def center ( self, t ):
+        t = np.asarray ( t, dtype = float )
+        if self.on_line: return _stack ( ( t - np.pi ) * self.r1, np.zeros_like ( t ) )
+        return circular ( t, self.r1 + self.r2 )
+
+    def contact ( self, t ):
+        # the point where the rolling circle touches the fixed one
+        t = np.asarray ( t, dtype = float )
+        if self.on_line: return _stack ( ( t - np.pi ) * self.r1, np.full_like ( t, -self.r2 ) )
+        return circular ( t, self.r1 )
+
+    def traced ( self, t ):
+        # the point of the rolling circle that draws the locus
+        if self.on_line: return cycloid_on_line ( t, self.r1, self.r2 )
+        return cycloid_on_circle ( t, self.r1, self.r2 )
+
+    def radius ( self, t ):
+        # the radius from the centre to the traced point, as an array of shape ( 2, 3 ) or ( N, 2, 3 )
+        return np.stack ( ( self.center ( t ), self.traced ( t ) ), axis = -2 )
+
+    def center_velocity ( self, t ):
+        t = np.asarray ( t, dtype = float )
+        if self.on_line: return _stack ( np.full_like ( t, self.r1 ), np.zeros_like ( t ) )
+        return _stack ( -np.sin ( t ), np.cos ( t ) ) * ( self.r1 + self.r2 )
+
+    def traced_velocity ( self, t ):
+        if self.on_line: return cycloid_on_line_velocity ( t, self.r1, self.r2 )
+        return cycloid_on_circle_velocity ( t, self.r1, self.r2 )
+
+    @property
+    def turns_per_revolution ( self ) -> float:
+        # how many times the rolling circle turns about its own centre while `t` goes from 0 to 2 pi
+        return abs ( self.k ) if self.on_line else abs ( self.k + 1 )
+
+    def turns ( self, t ):
+        return np.asarray ( t, dtype = float ) * self.turns_per_revolution / ( 2 * np.pi )
+
+    def bezier ( self, t_range = ( 0, 2 * np.pi ), tolerance = 0.004 ):
+        # the locus of the traced point, see `cycloid_on_circle_bezier`
+        bezier = cycloid_on_line_bezier if self.on_line else cycloid_on_circle_bezier
+        return bezier ( self.r1, self.r2, t_range, tolerance )
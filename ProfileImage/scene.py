@@ -1,4 +1,4 @@
-from manim import *
+from manim import ManimColor, MathTex, Scene
 
 class ProfileImageScene ( Scene ):
     def construct ( self ):
@@ -0,0 +1,37 @@
+from manim import VMobject
+import numpy as np
+
+from typing import Callable
+
+def adaptive_curve ( 
+        function: Callable [ [ np.ndarray ], np.ndarray ],
+        t_range: tuple [ float, float ] = ( 0, 1 ),
+        tolerance: float = 0.004,
+        initial_samples: int = 32,
+        max_depth: int = 16,
+        **kwargs,
+) -> VMobject:
+    # works like `ParametricFunction`, except that `function` is called with whole arrays of `t` values
+    # and returns ( N, 3 ) arrays of points, and that the samples are placed where the curve needs them:
+    # every interval whose midpoint is farther than `tolerance` ( in scene units ) from the middle of its chord
+    # is halved, until all are flat enough or have been halved `max_depth` times
+    # the result is a polyline, so cusps stay sharp; the default tolerance is about half a pixel at 1080p
+    t = np.linspace ( *t_range, initial_samples + 1 )
+    points = function ( t )
+    active = np.ones ( initial_samples, dtype = bool )
+    for _ in range ( max_depth ):
+        index = np.flatnonzero ( active )
+        if len ( index ) == 0: break
+        t_mid = ( t [ index ] + t [ index + 1 ] ) / 2
+        points_mid = function ( t_mid )
+        error = np.linalg.norm ( points_mid - ( points [ index ] + points [ index + 1 ] ) / 2, axis = -1 )
+        split = error > tolerance
+        active [ : ] = False
+        active [ index [ split ] ] = True
+        # the new point goes between the ends of its interval, and both halves are checked again
+        t = np.insert ( t, index [ split ] + 1, t_mid [ split ] )
+        points = np.insert ( points, index [ split ] + 1, points_mid [ split ], axis = 0 )
+        active = np.insert ( active, index [ split ] + 1, True )
+    curve = VMobject ( **kwargs )
+    curve.set_points_as_corners ( points )
+    return curve
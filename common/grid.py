@@ -0,0 +1,80 @@
+from manim import VGroup, VMobject
+from manim.utils.bezier import integer_interpolate, partial_bezier_points
+import numpy as np
+
+def _partial ( points: np.ndarray, a: float, b: float ) -> np.ndarray:
+    # the part of the cubic Bézier path `points` between the proportions `a` and `b`, as `VMobject.pointwise_become_partial`
+    quads = points.reshape ( -1, 4, 3 )
+    lower_index, lower_residue = integer_interpolate ( 0, len ( quads ), a )
+    upper_index, upper_residue = integer_interpolate ( 0, len ( quads ), b )
+    if lower_index == upper_index: return partial_bezier_points ( quads [ lower_index ], lower_residue, upper_residue )
+    return np.concatenate ( (
+        partial_bezier_points ( quads [ lower_index ], lower_residue, 1 ),
+        quads [ lower_index + 1: upper_index ].reshape ( -1, 3 ),
+        partial_bezier_points ( quads [ upper_index ], 0, upper_residue ),
+    ) )
+
+class MergedPath ( VMobject ):
+    # the paths of several vmobjects with the same style as the subpaths of one vmobject,
+    # which the camera projects, styles and strokes once instead of once per member
+    # `Create` and other partial animations reveal the members one after another, like on a group with `lag_ratio = 1`
+    def __init__ ( self, members: list [ VMobject ], **kwargs ):
+        super ( ).__init__ ( **kwargs )
+        self.match_style ( members [ 0 ], family = False )
+        self.joint_type, self.cap_style = members [ 0 ].joint_type, members [ 0 ].cap_style
+        self.z_index = members [ 0 ].z_index
+        self.set_points ( np.concatenate ( [ member.points for member in members ] ) )
+        # where each member's points end
+        self.member_ends = np.cumsum ( [ len ( member.points ) for member in members ] )
+
+    def pointwise_become_partial ( self, vmobject: VMobject, a: float, b: float ):
+        ends = getattr ( vmobject, "member_ends", None )
+        # once the points are no longer the members' ( e.g. aligned for a transform ), it is an ordinary path
+        if ends is None or len ( ends ) == 0 or ends [ -1 ] != len ( vmobject.points ):
+            return super ( ).pointwise_become_partial ( vmobject, a, b )
+        starts = np.concatenate ( ( [ 0 ], ends [ :-1 ] ) )
+        index = np.arange ( len ( ends ) )
+        lower = np.clip ( a * len ( ends ) - index, 0, 1 )
+        upper = np.clip ( b * len ( ends ) - index, 0, 1 )
+        pieces = [ ]
+        for i in np.flatnonzero ( upper > lower ):
+            points = vmobject.points [ starts [ i ]: ends [ i ] ]
+            pieces.append ( points if lower [ i ] == 0 and upper [ i ] == 1 else _partial ( points, lower [ i ], upper [ i ] ) )
+        if pieces: self.set_points ( np.concatenate ( pieces ) )
+        else: self.clear_points ( )
+        return self
+
+def _style_key ( mobject: VMobject ):
+    # mobjects that look the same when stroked as one path, or None for one that has to be drawn on its own:
+    # filled mobjects ( overlapping fills would change ), colour gradients, and shading depend on the single mobject
+    if (
+        not isinstance ( mobject, VMobject )
+        or mobject.get_fill_opacities ( ).any ( )
+        or mobject.shade_in_3d
+        or mobject.sheen_factor != 0
+    ): return None
+    stroke, background = mobject.get_stroke_rgbas ( ), mobject.get_stroke_rgbas ( background = True )
+    if ( stroke != stroke [ 0 ] ).any ( ) or ( background != background [ 0 ] ).any ( ): return None
+    return (
+        stroke [ 0 ].tobytes ( ), mobject.get_stroke_width ( ),
+        background [ 0 ].tobytes ( ), mobject.get_stroke_width ( background = True ),
+        mobject.joint_type, mobject.cap_style, mobject.z_index,
+    )
+
+def merge_by_style ( mobject: VMobject ) -> VGroup:
+    # a copy of `mobject` for drawing, e.g. a grid of many lines, with all members of the same style merged
+    # into one `MergedPath` per style, in the order their first member is drawn; it renders the same,
+    # except where differently styled members overlap, but is no longer structured like `mobject`
+    buckets, parts = { }, [ ]
+    for member in mobject.family_members_with_points ( ):
+        key = _style_key ( member )
+        if key is None:
+            copy = member.copy ( )
+            copy.submobjects = [ ]
+            parts.append ( copy )
+        elif key in buckets:
+            buckets [ key ].append ( member )
+        else:
+            buckets [ key ] = [ member ]
+            parts.append ( buckets [ key ] )
+    return VGroup ( *( MergedPath ( part ) if isinstance ( part, list ) else part for part in parts ) )
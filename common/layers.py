@@ -0,0 +1,89 @@
+from manim import Mobject, ValueTracker
+import numpy as np
+
+class StaticLayerScene:
+    # mixin for `Scene` and `ThreeDScene` subclasses, put it first: `class MyScene ( StaticLayerScene, Scene )`
+    # manim draws the mobjects that do not move during a play call once, into a background image, but only those
+    # that come before the first moving mobject in drawing order; everything after it is drawn again every frame
+    # here every mobject that is neither animated nor updated goes into the background, as long as no moving
+    # mobject overlaps it on screen: the overlap is checked every frame, and when it happens the play call falls
+    # back to manim's split, so drawing order is never changed where it could be seen
+    # value trackers are never drawn, so animating one does not make the mobjects after it move
+
+    # margin around bounding boxes for strokes and dots, in scene units
+    static_layer_padding = 0.1
+
+    def begin_animations ( self ) -> None:
+        self.__hoisted = [ ]
+        self.__fallback = False
+        super ( ).begin_animations ( )
+
+    def get_moving_mobjects ( self, *animations ) -> list [ Mobject ]:
+        camera = self.renderer.camera
+        animated = [ animation.mobject for animation in animations ]
+        updated = [ mobject for mobject in self.mobjects if mobject.get_family_updaters ( ) ]
+        moving = {
+            id ( member )
+            for mobject in [ *animated, *updated, *self.foreground_mobjects ]
+            for member in mobject.get_family ( )
+            if not isinstance ( member, ValueTracker )
+        }
+        # a moving camera changes every pixel
+        camera_mobjects = [
+            *getattr ( camera, "get_value_trackers", list ) ( ),
+            getattr ( camera, "_frame_center", None ),
+            getattr ( camera, "frame", None ),
+        ]
+        if any (
+            mobject is not None and ( mobject in animated or mobject.get_family_updaters ( ) )
+            for mobject in camera_mobjects
+        ): return list ( self.mobjects )
+
+        mobjects = self.get_mobject_family_members ( )
+        first = next ( ( i for i, mobject in enumerate ( mobjects ) if id ( mobject ) in moving ), len ( mobjects ) )
+        if self.__fallback: return mobjects [ first: ]
+        # positions in drawing order, only a moving mobject drawn before a hoisted one can end up above it
+        self.__moving = [ ( i, mobject ) for i, mobject in enumerate ( mobjects ) if i >= first and id ( mobject ) in moving ]
+        self.__hoisted = [ ( i, mobject ) for i, mobject in enumerate ( mobjects ) if i > first and id ( mobject ) not in moving ]
+        self.__hoisted_boxes = self.__screen_boxes ( self.__hoisted )
+        if self.__overlapping ( ): return mobjects [ first: ]
+        return [ mobject for _, mobject in self.__moving ]
+
+    def update_to_time ( self, t: float ):
+        super ( ).update_to_time ( t )
+        if len ( self.__hoisted ) and self.__overlapping ( ):
+            # a moving mobject reached a static one that is drawn above it, so draw them in order from now on
+            self.__fallback = True
+            self.__hoisted = [ ]
+            self.moving_mobjects, self.static_mobjects = self.get_moving_and_static_mobjects ( self.animations )
+            self.renderer.save_static_frame_data ( self, self.static_mobjects )
+
+    def __screen_boxes ( self, mobjects: list [ tuple [ int, Mobject ] ] ) -> tuple [ np.ndarray, np.ndarray ]:
+        # drawing positions and bounding boxes ( min and max corner in x and y ) of the mobjects that have points,
+        # as projected by the camera
+        positions, boxes = [ ], [ ]
+        project = getattr ( self.renderer.camera, "project_points", None )
+        for i, mobject in mobjects:
+            points = mobject.points
+            if len ( points ) == 0: continue
+            box = np.array ( ( points.min ( axis = 0 ), points.max ( axis = 0 ) ) )
+            if project is not None:
+                corners = np.array ( np.meshgrid ( *box.T, indexing = "ij" ) ).reshape ( 3, -1 ).T
+                projected = project ( corners )
+                box = np.array ( ( projected.min ( axis = 0 ), projected.max ( axis = 0 ) ) )
+            positions.append ( i )
+            boxes.append ( box [ :, :2 ] )
+        return np.array ( positions, dtype = int ), np.array ( boxes ).reshape ( -1, 2, 2 )
+
+    def __overlapping ( self ) -> bool:
+        # whether a moving mobject overlaps a hoisted one that is drawn after it
+        hoisted_positions, hoisted = self.__hoisted_boxes
+        if len ( hoisted ) == 0: return False
+        moving_positions, moving = self.__screen_boxes ( self.__moving )
+        pad = self.static_layer_padding
+        overlap = np.all (
+            ( moving [ :, np.newaxis, 0 ] - pad <= hoisted [ np.newaxis, :, 1 ] ) &
+            ( hoisted [ np.newaxis, :, 0 ] <= moving [ :, np.newaxis, 1 ] + pad ),
+            axis = -1,
+        )
+        return bool ( np.any ( overlap & ( moving_positions [ :, np.newaxis ] < hoisted_positions [ np.newaxis, : ] ) ) )
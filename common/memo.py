@@ -0,0 +1,84 @@
+import atexit
+import os
+import sys
+from collections import OrderedDict
+from functools import update_wrapper
+from typing import Callable, TextIO
+
+# set this environment variable to print the statistics of every cache when the process exits
+STATS_ENV = "FXP_CACHE_STATS"
+
+_caches: list [ "BoundedCache" ] = [ ]
+
+class BoundedCache:
+    # memoizes a function whose first argument is a float `t`
+    # - at most `maxsize` results are kept, the least recently used one is evicted first
+    # - if `quantum` is given, `t` is rounded to a multiple of it before lookup *and* evaluation,
+    #   so that nearby values share one entry
+    def __init__ ( self, function: Callable, maxsize: int = 4096, quantum: float | None = None ):
+        if maxsize <= 0: raise ValueError ( "`maxsize` must be positive" )
+        if quantum is not None and quantum <= 0: raise ValueError ( "`quantum` must be positive" )
+        update_wrapper ( self, function )
+        self.__function = function
+        self.__entries = OrderedDict ( )
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.hits = self.misses = self.evictions = 0
+        _caches.append ( self )
+
+    def __call__ ( self, t, *args ):
+        if self.quantum is None:
+            key = ( t, *args )
+        else:
+            n = round ( t / self.quantum )
+            key, t = ( n, *args ), n * self.quantum
+        entries = self.__entries
+        try:
+            value = entries [ key ]
+        except KeyError:
+            self.misses += 1
+            value = entries [ key ] = self.__function ( t, *args )
+            if len ( entries ) > self.maxsize:
+                entries.popitem ( last = False )
+                self.evictions += 1
+        else:
+            self.hits += 1
+            entries.move_to_end ( key )
+        return value
+
+    def __len__ ( self ):
+        return len ( self.__entries )
+
+    def clear ( self ):
+        self.__entries.clear ( )
+        self.hits = self.misses = self.evictions = 0
+
+    def stats ( self ) -> dict:
+        calls = self.hits + self.misses
+        return {
+            "name": self.__qualname__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / calls if calls else 0.0,
+            "size": len ( self ),
+            "maxsize": self.maxsize,
+            "evictions": self.evictions,
+            "quantum": self.quantum,
+        }
+
+def bounded_cache ( maxsize: int = 4096, quantum: float | None = None ):
+    return lambda function: BoundedCache ( function, maxsize, quantum )
+
+def cache_stats ( ) -> list [ dict ]:
+    return [ cache.stats ( ) for cache in _caches ]
+
+def dump_cache_stats ( file: TextIO = sys.stderr ):
+    for stats in cache_stats ( ):
+        print ( 
+            "{name}: {hits} hits, {misses} misses ({hit_rate:.1%}), "
+            "{size}/{maxsize} entries, {evictions} evictions, quantum = {quantum}".format ( **stats ),
+            file = file,
+        )
+
+if os.environ.get ( STATS_ENV ):
+    atexit.register ( dump_cache_stats )
@@ -0,0 +1,42 @@
+from manim import Camera, ThreeDCamera
+import numpy as np
+
+class ProjectiveThreeDCamera ( ThreeDCamera ):
+    # `ThreeDCamera` that projects points with one projective matrix, set up once per frame,
+    # instead of going through the camera trackers and the per-axis perspective factors for every mobject
+    # the result is the same as `ThreeDCamera.project_points`; points behind the camera, mobjects fixed in frame
+    # or in orientation, and the exponential projection take manim's path
+    # use it with `super ( ).__init__ ( camera_class = ProjectiveThreeDCamera )` in a `ThreeDScene`
+
+    def reset_rotation_matrix ( self ):
+        super ( ).reset_rotation_matrix ( )
+        # camera space is q = R ( p - c ) and the screen point q [ :2 ] * zoom * f / ( f - q [ 2 ] ),
+        # so X = f zoom q [ 0 ], Y = f zoom q [ 1 ] and W = f - q [ 2 ] are affine in p, and the screen point is X / W, Y / W
+        rotation = self.get_rotation_matrix ( )
+        self.__focal_distance = focal_distance = self.get_focal_distance ( )
+        scale = np.array ( ( focal_distance * self.get_zoom ( ), focal_distance * self.get_zoom ( ), -1 ) )
+        self.__matrix = rotation * scale [ :, np.newaxis ]
+        self.__offset = ( -( rotation @ self.frame_center ) * scale + ( 0, 0, focal_distance ) ) [ :, np.newaxis ]
+
+    def transform_points_pre_display ( self, mobject, points: np.ndarray ) -> np.ndarray:
+        if (
+            self.exponential_projection
+            or mobject in self.fixed_in_frame_mobjects
+            or mobject in self.fixed_orientation_mobjects
+        ): return super ( ).transform_points_pre_display ( mobject, points )
+        points = Camera.transform_points_pre_display ( self, mobject, points )
+        # computed as rows of X, Y and W, where whole rows are contiguous, and returned transposed
+        projected = self.__matrix @ points.T
+        projected += self.__offset
+        # manim pushes points behind the camera far out instead of mirroring them
+        if len ( points ) == 0 or projected [ 2 ].min ( ) <= 0: return self.project_points ( points )
+        projected [ :2 ] /= projected [ 2 ]
+        np.subtract ( self.__focal_distance, projected [ 2 ], out = projected [ 2 ] )
+        return projected.T
+
+    def get_mobjects_to_display ( self, *args, **kwargs ) -> list:
+        # manim orders only mobjects shaded in 3d by depth, every other one keeps its drawing order,
+        # so without any of them there is nothing to sort
+        mobjects = Camera.get_mobjects_to_display ( self, *args, **kwargs )
+        if not any ( getattr ( mobject, "shade_in_3d", False ) for mobject in mobjects ): return mobjects
+        return super ( ).get_mobjects_to_display ( *args, **kwargs )
@@ -0,0 +1,92 @@
+from manim import DEFAULT_FONT_SIZE, MathTex, SingleStringMathTex, VMobject
+import numpy as np
+
+class DecimalReadout ( VMobject ):
+    # a number display for values that change every frame, e.g. a counter driven by an updater
+    # it is laid out like `DecimalNumber`, but every glyph ( digit, decimal point, sign, unit ) is typeset
+    # only once per font size, in an atlas shared by all readouts. each position of the number is one
+    # permanent mobject, and `set_value` only copies the points of the atlas glyph into it
+    # the family never changes while the number keeps its length, which matters with the cairo renderer:
+    # it draws the family a play call started with, so swapped out mobjects would stay on screen
+    # as with `DecimalNumber`, positions added while a play call runs ( a longer number ) show from the next one
+    _atlas: dict [ tuple [ str, str, float ], VMobject ] = { }
+    # points of the atlas glyphs with their bottom left corner at the origin, with their width and height
+    _outlines: dict [ tuple [ str, str, float ], tuple [ np.ndarray, float, float ] ] = { }
+
+    def __init__ (
+            self,
+            number: float = 0,
+            num_decimal_places: int = 2,
+            unit: str | None = None,
+            font_size: float = DEFAULT_FONT_SIZE,
+            digit_buff_per_font_unit: float = 0.001,
+            unit_buff_per_font_unit: float = 0,
+            **kwargs,
+    ):
+        super ( ).__init__ ( **kwargs )
+        self.num_decimal_places = num_decimal_places
+        self.unit = unit
+        self.__font_size = font_size
+        self.__digit_buff = digit_buff_per_font_unit * font_size
+        self.__unit_buff = unit_buff_per_font_unit * font_size
+        self.__slots: list [ VMobject ] = [ ]
+        self.__unit_sign = None if unit is None else self.__slot ( unit, SingleStringMathTex )
+        self.__string = None
+        self.number = None
+        self.set_value ( number )
+
+    def __outline ( self, string: str, mob_class: type ) -> tuple [ np.ndarray, float, float ]:
+        key = ( mob_class.__name__, string, self.__font_size )
+        if key not in self._outlines:
+            glyph = self._atlas [ key ] = mob_class ( string, font_size = self.__font_size )
+            points = np.concatenate ( [ member.points for member in glyph.family_members_with_points ( ) ] )
+            low, high = points.min ( axis = 0 ), points.max ( axis = 0 )
+            self._outlines [ key ] = ( points - low, high [ 0 ] - low [ 0 ], high [ 1 ] - low [ 1 ] )
+        return self._outlines [ key ]
+
+    def __slot ( self, string: str, mob_class: type ) -> VMobject:
+        # a new position, styled like the existing ones, or like the typeset glyph for the first one
+        self.__outline ( string, mob_class )
+        model = self.__slots [ 0 ] if self.__slots else self._atlas [ ( mob_class.__name__, string, self.__font_size ) ]
+        return VMobject ( ).match_style ( model.family_members_with_points ( ) [ 0 ] )
+
+    def get_value ( self ) -> float:
+        return self.number
+
+    def set_value ( self, number: float ):
+        self.number = number
+        string = f"{number:.{self.num_decimal_places}f}"
+        if string == self.__string: return self
+
+        # the left edge and the baseline ( the bottom of the last digit ) stay in place
+        if self.__string is None:
+            left, baseline, z = 0.0, 0.0, 0.0
+        else:
+            last = self.__slots [ len ( self.__string ) - 1 ].points
+            left, baseline, z = self.__slots [ 0 ].points [ :, 0 ].min ( ), last [ :, 1 ].min ( ), last [ 0, 2 ]
+        self.__string = string
+
+        while len ( self.__slots ) < len ( string ): self.__slots.append ( self.__slot ( string [ 0 ], MathTex ) )
+        outlines = [ self.__outline ( char, MathTex ) for char in string ]
+        x, top = left, baseline
+        for i, ( slot, ( points, width, height ) ) in enumerate ( zip ( self.__slots, outlines ) ):
+            bottom = baseline
+            if string [ i ] == "-" and i + 1 < len ( string ):
+                # like `DecimalNumber`, the top of a minus sign is at half the height of the next glyph
+                bottom = baseline + outlines [ i + 1 ] [ 2 ] / 2 - height
+            else:
+                top = max ( top, baseline + height )
+            slot.set_points ( points + ( x, bottom, z ) )
+            x += width + self.__digit_buff
+        for slot in self.__slots [ len ( string ): ]: slot.clear_points ( )
+
+        if self.__unit_sign is not None:
+            points, width, height = self.__outline ( self.unit, SingleStringMathTex )
+            # `DecimalNumber` puts both buffers before the unit, and aligns superscript units to the top
+            x += self.__unit_buff
+            bottom = top - height if self.unit.startswith ( "^" ) else baseline
+            self.__unit_sign.set_points ( points + ( x, bottom, z ) )
+
+        members = [ *self.__slots, *( [ self.__unit_sign ] if self.__unit_sign is not None else [ ] ) ]
+        if self.submobjects != members: self.submobjects = members
+        return self
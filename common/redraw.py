@@ -0,0 +1,27 @@
+from manim import Line, Mobject
+import numpy as np
+
+from typing import Callable
+
+# positions of the 4 points of a straight cubic Bézier segment, relative to its start and end
+_LINE_WEIGHTS = np.linspace ( 0, 1, 4 ) [ :, np.newaxis ]
+
+def redraw_in_place ( mob: Mobject, write_points: Callable [ [ np.ndarray ], None ] ) -> Mobject:
+    # a cheaper `always_redraw`: instead of building a new mobject every frame,
+    # `write_points` overwrites the point array of `mob` in place
+    mob.add_updater ( lambda mob: write_points ( mob.points ) )
+    return mob
+
+def line_in_place ( endpoints: Callable [ [ ], np.ndarray ], **kwargs ) -> Line:
+    # a `Line` that follows `endpoints ( )`, which returns the start and the end point
+    start, end = endpoints ( )
+    line = Line ( start, end, **kwargs )
+    delta = np.empty ( 3 )
+
+    def write_points ( points ):
+        start, end = endpoints ( )
+        np.subtract ( end, start, out = delta )
+        np.multiply ( _LINE_WEIGHTS, delta, out = points )
+        points += start
+
+    return redraw_in_place ( line, write_points )
@@ -0,0 +1,74 @@
+from manim import Animation, ValueTracker, config
+import numpy as np
+
+from typing import Callable
+
+from .memo import BoundedCache
+
+# results kept per function for lookups outside of timeline plays
+DIRECT_CACHE_SIZE = 16
+
+class ThetaTimeline:
+    # drives `tracker` with values that are computed for every frame of a `self.play` call
+    # before the first frame is rendered. while such an animation is playing, `lookup` 
+    # returns one row of a table computed from all these values in one vectorized call, 
+    # otherwise it evaluates the function at the current value of `tracker`, through a small cache per
+    # function, since updaters see the same value in every frame of other plays and waits
+    # ( set `FXP_CACHE_STATS` to see how often it hits, see `common.memo` )
+    def __init__ ( self, tracker: ValueTracker ):
+        self.tracker = tracker
+        self.frame: int | None = None
+        self.__values = None
+        self.__tables = { }
+        self.__direct: dict [ Callable, BoundedCache ] = { }
+
+    def animate ( self, end: float, **kwargs ) -> Animation:
+        return _TimelineAnimation ( self, end, **kwargs )
+
+    def lookup ( self, function: Callable [ [ np.ndarray ], np.ndarray ] ):
+        if self.frame is None:
+            cache = self.__direct.get ( function )
+            if cache is None: cache = self.__direct [ function ] = BoundedCache ( function, DIRECT_CACHE_SIZE )
+            return cache ( self.tracker.get_value ( ) )
+        try:
+            table = self.__tables [ function ]
+        except KeyError:
+            table = self.__tables [ function ] = function ( self.__values )
+        return table [ self.frame ]
+
+    def _start ( self, values: np.ndarray ):
+        # tables are built by `lookup` on first use, so functions only used in earlier plays cost nothing
+        self.__values = values
+        self.__tables = { }
+        self.frame = 0
+
+    def _stop ( self ):
+        self.frame = None
+
+class _TimelineAnimation ( Animation ):
+    def __init__ ( self, timeline: ThetaTimeline, end: float, **kwargs ):
+        super ( ).__init__ ( timeline.tracker, **kwargs )
+        self.__timeline = timeline
+        self.__end = end
+
+    def begin ( self ):
+        # `run_time` and `rate_func` are read here, after `self.play` has applied its own arguments
+        # the frame times are the same as the ones `Scene` steps through
+        self.__frames_per_run = self.run_time * config.frame_rate
+        times = np.arange ( 0, self.run_time, 1 / config.frame_rate )
+        alphas = np.append ( times / self.run_time, 1 )
+        eased = np.fromiter ( map ( self.rate_func, alphas ), float, len ( alphas ) )
+        start = self.mobject.get_value ( )
+        self.__values = start + ( self.__end - start ) * eased
+        self.__timeline._start ( self.__values )
+        super ( ).begin ( )
+
+    def interpolate ( self, alpha: float ):
+        last = len ( self.__values ) - 1
+        frame = last if alpha >= 1 else min ( int ( alpha * self.__frames_per_run + 0.5 ), last )
+        self.__timeline.frame = frame
+        self.mobject.set_value ( self.__values [ frame ] )
+
+    def clean_up_from_scene ( self, scene ):
+        super ( ).clean_up_from_scene ( scene )
+        self.__timeline._stop ( )
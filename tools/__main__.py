@@ -0,0 +1,239 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from .scenes import ROOT, scene_file, scenes
+
+def add_render_options ( parser: argparse.ArgumentParser ):
+    from .jobs import QUALITIES
+    parser.add_argument ( "-q", "--quality", choices = QUALITIES, default = "l" )
+    parser.add_argument ( "-j", "--jobs", type = int, default = os.cpu_count ( ), help = "number of worker processes" )
+    parser.add_argument ( "--media-dir", default = str ( ROOT / "media" ) )
+    parser.add_argument ( "--tex-dir", help = "tex cache shared by all workers, defaults to `<media dir>/Tex`" )
+    parser.add_argument ( "--no-prewarm", action = "store_true", help = "do not typeset the tex strings before rendering" )
+
+def shared_config ( args, scenes: list [ str ] ) -> dict:
+    # manim config of every job, after filling the shared tex cache for `scenes`
+    from .jobs import QUALITIES
+    from .texcache import prewarm
+    tex_dir = Path ( args.tex_dir or Path ( args.media_dir ) / "Tex" ).resolve ( )
+    if not args.no_prewarm: prewarm ( [ scene_file ( name ) for name in scenes ], tex_dir, args.jobs )
+    return { "quality": QUALITIES [ args.quality ], "tex_dir": str ( tex_dir ) }
+
+def add_hook_options ( parser: argparse.ArgumentParser ):
+    parser.add_argument ( 
+        "--profile-updaters", action = "store_true", 
+        help = "time every updater call and write a trace to `<media dir>/profiles`",
+    )
+    parser.add_argument ( 
+        "--content-hash", action = "store_true", 
+        help = "key the partial movie cache by the state going into each play call, and report cache hits",
+    )
+    parser.add_argument ( 
+        "--pipeline", action = "store_true", 
+        help = "encode in a separate process while rendering, through frame buffers in shared memory",
+    )
+
+def job_hooks ( args ) -> list:
+    from .cache import record_cache_use, use_content_hash
+    from .pipeline import pipelined_encoding
+    from .profiling import profile_updaters
+    hooks = [ ]
+    if args.profile_updaters: hooks.append ( profile_updaters )
+    if args.content_hash: hooks += [ use_content_hash, record_cache_use ]
+    if args.pipeline: hooks.append ( pipelined_encoding )
+    return hooks
+
+def report ( results ) -> int:
+    from .cache import report_cache_use
+    for result in results: report_cache_use ( result )
+    return int ( any ( result.status != "ok" for result in results ) )
+
+def render_command ( args ) -> int:
+    from .jobs import RenderJob, run_jobs
+    names = args.scenes or list ( scenes ( ) )
+    config = shared_config ( args, names )
+    jobs = [ RenderJob ( name, config = dict ( config ), hooks = job_hooks ( args ) ) for name in names ]
+    return report ( run_jobs ( jobs, args.media_dir, args.jobs ) )
+
+def sweep_command ( args ) -> int:
+    from .jobs import run_jobs
+    from .sweep import parameter_sets, sweep_jobs
+    sets = parameter_sets ( args.set, args.params )
+    jobs = sweep_jobs ( args.scene, sets, shared_config ( args, [ args.scene ] ), job_hooks ( args ) )
+    return report ( run_jobs ( jobs, args.media_dir, args.jobs, f"sweep_{args.scene}.json" ) )
+
+def segments_command ( args ) -> int:
+    from .jobs import RenderJob
+    from .segments import render_segments
+    job = RenderJob ( args.scene, config = shared_config ( args, [ args.scene ] ), hooks = job_hooks ( args ) )
+    results, output = render_segments ( job, args.media_dir, args.jobs )
+    report ( results )
+    return int ( output is None )
+
+def tex_command ( args ) -> int:
+    from .texcache import collect_tex, prewarm
+    files = [ scene_file ( name ) for name in args.scenes or scenes ( ) ]
+    if args.list:
+        for item in sorted ( set ( ).union ( *map ( collect_tex, set ( files ) ) ) ): print ( *item )
+        return 0
+    tex_dir = Path ( args.tex_dir or Path ( args.media_dir ) / "Tex" ).resolve ( )
+    return int ( bool ( prewarm ( files, tex_dir, args.jobs ) ) )
+
+def bench_command ( args ) -> int:
+    from .bench import BASELINE, bench
+    names = args.scenes or list ( scenes ( ) )
+    config = shared_config ( args, names )
+    return bench ( 
+        names, config, 
+        media_dir = Path ( args.media_dir ) / "bench", 
+        workers = args.jobs,
+        baseline = Path ( args.baseline or BASELINE ), 
+        threshold = args.threshold, 
+        save = args.save,
+    )
+
+def dryrun_command ( args ) -> int:
+    from .dryrun import dry_run_jobs
+    from .jobs import run_jobs
+    names = args.scenes or list ( scenes ( ) )
+    jobs = dry_run_jobs ( names, shared_config ( args, names ), args.track )
+    results = run_jobs ( jobs, args.media_dir, args.jobs, "dryrun_manifest.json" )
+    return int ( any ( result.status != "ok" for result in results ) )
+
+def preview_command ( args ) -> int:
+    from .jobs import RenderJob
+    from .preview import preview, refine
+    config = shared_config ( args, [ args.scene ] )
+    job = RenderJob ( args.scene, config = config, hooks = job_hooks ( args ) )
+    if args.refine_only: return int ( refine ( job, args.media_dir ).status != "ok" )
+    refine_argv = [ 
+        "preview", args.scene, "--refine-only", "--no-prewarm",
+        "-q", args.quality, "--media-dir", str ( Path ( args.media_dir ).resolve ( ) ), "--tex-dir", config [ "tex_dir" ],
+        *( [ "--profile-updaters" ] if args.profile_updaters else [ ] ),
+        *( [ "--content-hash" ] if args.content_hash else [ ] ),
+        *( [ "--pipeline" ] if args.pipeline else [ ] ),
+    ]
+    return preview ( job, args.media_dir, args.preview_fps, not args.no_open, refine_argv )
+
+def imports_command ( args ) -> int:
+    from .startup import report
+    report ( args.scenes or list ( scenes ( ) ), args.top )
+    return 0
+
+def list_command ( args ) -> int:
+    import json
+    from dataclasses import asdict
+    found = scenes ( )
+    if args.json:
+        print ( json.dumps ( [ asdict ( info ) for info in found.values ( ) ], indent = 1 ) )
+        return 0
+    for info in found.values ( ):
+        print ( f"{info.name} ( {', '.join ( info.bases )} )  {info.file}:{info.line}" )
+        for parameter in info.parameters or [ ]: print ( f"    {parameter}" )
+    return 0
+
+def main ( argv = None ) -> int:
+    parser = argparse.ArgumentParser ( prog = "python -m tools" )
+    commands = parser.add_subparsers ( dest = "command", required = True )
+
+    list_ = commands.add_parser ( "list", help = "list the scenes and their constructor arguments, without importing them" )
+    list_.add_argument ( "--json", action = "store_true", help = "print the scene index as JSON" )
+    list_.set_defaults ( run = list_command )
+
+    render = commands.add_parser ( "render", help = "render scenes in parallel, all of them by default" )
+    render.add_argument ( "scenes", nargs = "*", metavar = "scene", help = "see `python -m tools list`" )
+    add_render_options ( render )
+    add_hook_options ( render )
+    render.set_defaults ( run = render_command )
+
+    sweep = commands.add_parser ( 
+        "sweep", 
+        help = "render one scene for many sets of constructor arguments",
+        epilog = "example: python -m tools sweep CircleRotationScene --set r2=1,0.5,0.4 --set easing=smooth,linear",
+    )
+    sweep.add_argument ( "scene" )
+    sweep.add_argument ( 
+        "--set", action = "append", default = [ ], metavar = "NAME=V1,V2,...", 
+        help = "values of one constructor argument; every combination of all `--set` options is rendered",
+    )
+    sweep.add_argument ( "--params", metavar = "FILE", help = "JSON file with a list of argument objects" )
+    add_render_options ( sweep )
+    add_hook_options ( sweep )
+    sweep.set_defaults ( run = sweep_command )
+
+    segments = commands.add_parser ( 
+        "segments", 
+        help = "render one scene split into ranges of play calls on several processes, then stitch the parts",
+    )
+    segments.add_argument ( "scene" )
+    add_render_options ( segments )
+    add_hook_options ( segments )
+    segments.set_defaults ( run = segments_command )
+
+    tex = commands.add_parser ( "tex", help = "typeset the tex strings of scenes in parallel into the shared tex cache" )
+    tex.add_argument ( "scenes", nargs = "*", metavar = "scene" )
+    tex.add_argument ( "--list", action = "store_true", help = "only print the strings that would be typeset" )
+    add_render_options ( tex )
+    tex.set_defaults ( run = tex_command )
+
+    bench = commands.add_parser ( 
+        "bench", 
+        help = "time the renders of scenes and compare them with the saved baseline",
+        epilog = "the exit status is 1 when a scene got slower than the baseline by more than the threshold",
+    )
+    bench.add_argument ( "scenes", nargs = "*", metavar = "scene" )
+    add_render_options ( bench )
+    bench.set_defaults ( jobs = 1 )
+    bench.add_argument ( "--baseline", metavar = "FILE", help = "defaults to `benchmarks/baseline.json`" )
+    bench.add_argument ( "--threshold", type = float, default = 0.1, help = "allowed slowdown, 0.1 = 10%%" )
+    bench.add_argument ( "--save", action = "store_true", help = "store the results as the new baseline" )
+    bench.set_defaults ( run = bench_command )
+
+    dryrun = commands.add_parser ( 
+        "dryrun", 
+        help = "run scenes frame by frame without drawing or encoding, and record the state of their mobjects",
+        epilog = "example: python -m tools dryrun CircleRotationScene --track theta trace_dot",
+    )
+    dryrun.add_argument ( "scenes", nargs = "*", metavar = "scene" )
+    dryrun.add_argument ( 
+        "--track", nargs = "+", default = [ ], metavar = "NAME",
+        help = "local variables of `construct` to record, all mobjects by default",
+    )
+    add_render_options ( dryrun )
+    dryrun.set_defaults ( run = dryrun_command )
+
+    preview = commands.add_parser ( 
+        "preview", 
+        help = "render a quick low resolution preview of a scene, then the full quality movie in the background",
+        epilog = "the full quality render reuses the partial movies of every play call that did not change",
+    )
+    preview.add_argument ( "scene" )
+    add_render_options ( preview )
+    add_hook_options ( preview )
+    preview.set_defaults ( quality = "h" )
+    preview.add_argument ( "--preview-fps", type = int, default = 10, help = "frame rate of the preview" )
+    preview.add_argument ( "--no-open", action = "store_true", help = "do not open the preview when it is ready" )
+    preview.add_argument ( "--refine-only", action = "store_true", help = "only render the full quality movie, and wait for it" )
+    preview.set_defaults ( run = preview_command )
+
+    imports = commands.add_parser ( 
+        "imports", 
+        help = "show how long importing manim and the scene modules takes, and how fast a worker starts",
+    )
+    imports.add_argument ( "scenes", nargs = "*", metavar = "scene" )
+    imports.add_argument ( "--top", type = int, default = 12, help = "number of slowest packages to list" )
+    imports.set_defaults ( run = imports_command )
+
+    args = parser.parse_args ( argv )
+    try:
+        return args.run ( args )
+    except ValueError as e:
+        parser.error ( str ( e ) )
+    except RuntimeError as e:
+        print ( f"error: {e}", file = sys.stderr )
+        return 1
+
+if __name__ == "__main__":
+    sys.exit ( main ( ) )
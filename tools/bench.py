@@ -0,0 +1,123 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from .jobs import RenderJob, RenderResult, run_jobs
+from .scenes import ROOT
+
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+class _PhaseTimers:
+    # exclusive wall time per phase: time spent in a nested phase is not counted for the outer one
+    def __init__ ( self ):
+        self.totals: dict [ str, float ] = { }
+        self.__stack: list [ list ] = [ ]
+
+    def wrap ( self, phase: str, function ):
+        def timed ( *args, **kwargs ):
+            now = time.perf_counter ( )
+            if self.__stack: self.__stack [ -1 ] [ 1 ] += now - self.__stack [ -1 ] [ 2 ]
+            self.__stack.append ( [ phase, 0.0, now ] )
+            try:
+                return function ( *args, **kwargs )
+            finally:
+                now = time.perf_counter ( )
+                _, elapsed, since = self.__stack.pop ( )
+                self.totals [ phase ] = self.totals.get ( phase, 0.0 ) + elapsed + now - since
+                if self.__stack: self.__stack [ -1 ] [ 2 ] = now
+        return timed
+
+def _peak_rss_mb ( ) -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage ( resource.RUSAGE_SELF ).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+def install_phase_timers ( scene ):
+    # hook: splits the render time into updaters, animation interpolation ( geometry ),
+    # rasterization and encoding, and counts the frames written
+    timers = _PhaseTimers ( )
+    renderer = scene.renderer
+    scene.update_mobjects = timers.wrap ( "updaters", scene.update_mobjects )
+    scene.update_to_time = timers.wrap ( "geometry", scene.update_to_time )
+    renderer.update_frame = timers.wrap ( "rasterize", renderer.update_frame )
+    renderer.file_writer.write_frame = timers.wrap ( "encode", renderer.file_writer.write_frame )
+
+    frames = 0
+    add_frame = renderer.add_frame
+    def counting_add_frame ( frame, num_frames = 1 ):
+        nonlocal frames
+        if not renderer.skip_animations: frames += num_frames
+        return add_frame ( frame, num_frames )
+    renderer.add_frame = counting_add_frame
+
+    return lambda: { "frames": frames, "phases": timers.totals, "peak_rss_mb": _peak_rss_mb ( ) }
+
+def summarize ( result: RenderResult ) -> dict:
+    frames = result.extra.get ( "frames", 0 )
+    return {
+        "seconds": result.seconds,
+        "frames": frames,
+        "fps": frames / result.seconds if result.seconds else 0.0,
+        "peak_rss_mb": result.extra.get ( "peak_rss_mb" ),
+        "phases": result.extra.get ( "phases", { } ),
+    }
+
+def run_benchmarks ( scenes: list [ str ], config: dict, media_dir: Path, workers: int = 1 ) -> dict:
+    # scenes render one after another by default, so that they do not compete for the CPU;
+    # manim's partial movie cache is off, or every run after the first would time cache hits instead of renders
+    config = { **config, "disable_caching": True }
+    jobs = [ RenderJob ( name, config = dict ( config ), hooks = [ install_phase_timers ] ) for name in scenes ]
+    results = run_jobs ( jobs, media_dir, workers, manifest_name = None )
+    failures = [ result.name for result in results if result.status != "ok" ]
+    return {
+        "config": config,
+        "platform": sys.platform,
+        "scenes": { result.name: summarize ( result ) for result in results if result.status == "ok" },
+        "failures": failures,
+    }
+
+def compare ( current: dict, baseline: dict, threshold: float ) -> list [ str ]:
+    # prints current against baseline timings and returns the scenes that got slower by more than `threshold`
+    regressions = [ ]
+    print ( f"{'scene':<32}{'baseline':>10}{'current':>10}{'change':>9}{'fps':>8}{'rss MB':>9}" )
+    for name, stats in current [ "scenes" ].items ( ):
+        base = baseline.get ( "scenes", { } ).get ( name )
+        rss = stats [ "peak_rss_mb" ]
+        rss = f"{rss:9.0f}" if rss is not None else f"{'-':>9}"
+        if base is None:
+            print ( f"{name:<32}{'-':>10}{stats [ 'seconds' ]:>9.2f}s{'new':>9}{stats [ 'fps' ]:>8.1f}{rss}" )
+            continue
+        change = stats [ "seconds" ] / base [ "seconds" ] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        if flag: regressions.append ( name )
+        print ( f"{name:<32}{base [ 'seconds' ]:>9.2f}s{stats [ 'seconds' ]:>9.2f}s{change:>+9.1%}"
+                f"{stats [ 'fps' ]:>8.1f}{rss}{flag}" )
+    return regressions
+
+def bench ( 
+        scenes: list [ str ], 
+        config: dict, 
+        media_dir: Path,
+        workers: int = 1,
+        baseline: Path = BASELINE, 
+        threshold: float = 0.1, 
+        save: bool = False,
+) -> int:
+    # renders `scenes` into `media_dir`, writes the results to `<media_dir>/bench.json` and compares them with `baseline`
+    # returns the exit status: 1 if a scene failed or got slower than the baseline by more than `threshold`
+    current = run_benchmarks ( scenes, config, media_dir, workers )
+    ( Path ( media_dir ) / "bench.json" ).write_text ( json.dumps ( current, indent = 4 ), encoding = "utf-8" )
+    reference = json.loads ( baseline.read_text ( encoding = "utf-8" ) ) if baseline.exists ( ) else { }
+    if reference.get ( "config" ) not in ( None, config ):
+        print ( f"warning: the baseline was recorded with {reference [ 'config' ]}" )
+    regressions = compare ( current, reference, threshold )
+    if save:
+        baseline.parent.mkdir ( parents = True, exist_ok = True )
+        baseline.write_text ( json.dumps ( current, indent = 4 ), encoding = "utf-8" )
+        print ( f"baseline saved to {baseline}" )
+    if regressions: print ( f"{len ( regressions )} scene(s) slower than the baseline by more than {threshold:.0%}" )
+    return int ( bool ( regressions or current [ "failures" ] ) )
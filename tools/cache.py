@@ -0,0 +1,215 @@
+import hashlib
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+
+from .jobs import RenderResult
+from .scenes import ROOT
+
+# camera attributes larger than this are frame buffers, not settings
+_MAX_CAMERA_ARRAY = 64
+# camera attributes that are frame buffers or caches of them, skipped like manim's own hash does;
+# `pixel_array_to_cairo_context` is keyed by the id of the array
+_CAMERA_SKIPPED = { "background", "pixel_array", "pixel_array_to_cairo_context" }
+
+class _StateDigest:
+    # feeds the state of objects into a hash: numbers, strings and arrays by value, functions by their bytecode,
+    # constants, closure values and the globals they use ( not by name or line, so that edits elsewhere in the file
+    # do not matter ), mobjects and other objects by their attributes, each object at most once
+    # classes of the project are hashed with the bytecode of their methods, so that editing a method is seen;
+    # manim's own classes and functions outside the project only by name
+    # the scene, the renderer and the camera are only represented by their class, they are hashed separately
+    def __init__ ( self, opaque: tuple = ( ) ):
+        self.digest = hashlib.blake2b ( digest_size = 8 )
+        self.seen = set ( )
+        self.opaque = opaque
+
+    def tag ( self, *parts ):
+        self.digest.update ( repr ( parts ).encode ( ) )
+
+    def sub_digest ( self, value ) -> str:
+        # the digest of `value` on its own, to order the keys of dicts and the members of sets by their state,
+        # since their `repr` may be the default one with the object's address
+        state = _StateDigest ( self.opaque )
+        state.feed ( value )
+        return state.hexdigest ( )
+
+    def feed ( self, value ):
+        if value is None or isinstance ( value, ( bool, int, float, complex, str, bytes ) ):
+            return self.tag ( value )
+        if isinstance ( value, np.generic ): return self.tag ( value.item ( ) )
+        if isinstance ( value, np.ndarray ):
+            self.tag ( "array", value.dtype.str, value.shape )
+            if value.dtype != object: return self.digest.update ( np.ascontiguousarray ( value ).tobytes ( ) )
+            for item in value.flat: self.feed ( item )
+            return
+        if isinstance ( value, ( list, tuple ) ):
+            self.tag ( type ( value ).__name__, len ( value ) )
+            for item in value: self.feed ( item )
+            return
+        if isinstance ( value, ( set, frozenset ) ):
+            return self.tag ( "set", sorted ( map ( self.sub_digest, value ) ) )
+        if isinstance ( value, dict ):
+            self.tag ( "dict", len ( value ) )
+            keys = [ ( self.sub_digest ( key ), key ) for key in value ]
+            if len ( { digest for digest, _ in keys } ) < len ( keys ):
+                # keys with the same state are told apart by their values
+                keys = [ ( digest + self.sub_digest ( value [ key ] ), key ) for digest, key in keys ]
+            for digest, key in sorted ( keys, key = lambda entry: entry [ 0 ] ):
+                self.tag ( digest )
+                self.feed ( value [ key ] )
+            return
+
+        if id ( value ) in self.seen: return self.tag ( "seen", type ( value ).__qualname__ )
+        self.seen.add ( id ( value ) )
+        if isinstance ( value, types.CodeType ):
+            self.tag ( "code", value.co_code, value.co_names, value.co_varnames )
+            return self.feed ( value.co_consts )
+        if isinstance ( value, types.FunctionType ):
+            self.feed ( value.__code__ )
+            self.feed ( value.__defaults__ )
+            self.feed ( [ _cell_contents ( cell ) for cell in value.__closure__ or ( ) ] )
+            return self.feed_globals ( value )
+        if isinstance ( value, types.MethodType ):
+            self.feed ( value.__func__ )
+            return self.feed ( value.__self__ )
+        if isinstance ( value, ( types.BuiltinFunctionType, types.ModuleType, type ) ):
+            self.tag ( getattr ( value, "__module__", None ), getattr ( value, "__qualname__", value.__name__ ) )
+            if isinstance ( value, type ): self.feed_class ( value )
+            return
+
+        kind = type ( value )
+        self.tag ( "object", kind.__module__, kind.__qualname__ )
+        if isinstance ( value, self.opaque ): return
+        self.feed ( kind )
+        attributes = getattr ( value, "__dict__", None )
+        if attributes is None: return self.tag ( repr ( value ) if kind.__repr__ is not object.__repr__ else None )
+        for key in sorted ( attributes ):
+            self.tag ( key )
+            self.feed ( attributes [ key ] )
+
+    def feed_globals ( self, function: types.FunctionType ):
+        # the module globals `function` reads: functions and classes through `feed`, plain values by value,
+        # and for modules of the project the attributes the code reads from them
+        if not _is_project_module ( function.__module__ ): return
+        names = _global_names ( function.__code__ )
+        namespace = function.__globals__
+        for name in sorted ( names ):
+            if name not in namespace: continue
+            value = namespace [ name ]
+            if isinstance ( value, types.ModuleType ):
+                if not _is_project_module ( value.__name__ ): continue
+                self.tag ( "module", name )
+                for attribute in sorted ( names ):
+                    if attribute in vars ( value ):
+                        self.tag ( attribute )
+                        self.feed_global ( vars ( value ) [ attribute ] )
+            else:
+                self.tag ( "global", name )
+                self.feed_global ( value )
+
+    def feed_global ( self, value ):
+        # other objects, e.g. manim's `config`, hold settings that are not part of the code
+        if isinstance ( value, ( types.FunctionType, type, types.ModuleType, np.ndarray, list, tuple, dict, set, frozenset ) ) \
+                or value is None or isinstance ( value, ( bool, int, float, complex, str, bytes, np.generic ) ) \
+                or _is_project_module ( type ( value ).__module__ ):
+            self.feed ( value )
+        else:
+            self.tag ( "global object", type ( value ).__module__, type ( value ).__qualname__ )
+
+    def feed_class ( self, kind: type ):
+        # the bytecode of every method and property, and the plain class attributes, of a class of the project and its bases
+        if not _is_project_module ( kind.__module__ ) or issubclass ( kind, self.opaque ): return
+        for base in kind.__bases__: self.feed ( base )
+        namespace = vars ( kind )
+        for key in sorted ( namespace ):
+            value = namespace [ key ]
+            if isinstance ( value, ( staticmethod, classmethod ) ): value = value.__func__
+            if isinstance ( value, property ): value = ( value.fget, value.fset, value.fdel )
+            if isinstance ( value, ( types.FunctionType, tuple, bool, int, float, complex, str ) ):
+                self.tag ( key )
+                self.feed ( value )
+
+    def hexdigest ( self ) -> str:
+        return self.digest.hexdigest ( )
+
+_project_modules: dict [ str, bool ] = { }
+
+def _is_project_module ( name: str ) -> bool:
+    # whether the module is a file of this project, and not of manim or another installed package
+    if name not in _project_modules:
+        file = getattr ( sys.modules.get ( name ), "__file__", None )
+        path = Path ( file ).resolve ( ) if file else None
+        _project_modules [ name ] = path is not None and ROOT in path.parents \
+            and not { "site-packages", "venv", ".venv" } & set ( path.parts )
+    return _project_modules [ name ]
+
+def _global_names ( code: types.CodeType ) -> set [ str ]:
+    # the names read by `code` and the functions and classes defined in it
+    names = set ( code.co_names )
+    for constant in code.co_consts:
+        if isinstance ( constant, types.CodeType ): names |= _global_names ( constant )
+    return names
+
+def _cell_contents ( cell ):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return None
+
+def _opaque_types ( ) -> tuple:
+    from manim import Camera, Scene
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    return ( Scene, Camera, CairoRenderer, SceneFileWriter )
+
+def _camera_digest ( camera, opaque: tuple ) -> str:
+    state = _StateDigest ( opaque )
+    state.tag ( type ( camera ).__module__, type ( camera ).__qualname__ )
+    for key, value in sorted ( vars ( camera ).items ( ) ):
+        if key in _CAMERA_SKIPPED: continue
+        if isinstance ( value, np.ndarray ) and value.size > _MAX_CAMERA_ARRAY: continue
+        state.tag ( key )
+        state.feed ( value )
+    return state.hexdigest ( )
+
+def content_hash ( *args, **kwargs ) -> str:
+    # replacement of `manim.utils.hashing.get_hash_from_play_call`, from the state going into the play call:
+    # the camera settings, the animations ( with the mobjects they animate ) and every mobject on the scene
+    # the arguments are taken by name as well as by position, like manim's own function
+    arguments = dict ( zip ( ( "scene_object", "camera_object", "animations_list", "current_mobjects_list" ), args ) )
+    arguments.update ( kwargs )
+    opaque = _opaque_types ( )
+    animations, mobjects = _StateDigest ( opaque ), _StateDigest ( opaque )
+    animations.feed ( list ( arguments [ "animations_list" ] ) )
+    mobjects.feed ( list ( arguments [ "current_mobjects_list" ] ) )
+    return f"{_camera_digest ( arguments [ 'camera_object' ], opaque )}_{animations.hexdigest ( )}_{mobjects.hexdigest ( )}"
+
+def use_content_hash ( scene ):
+    # hook: names the partial movie of each play call by `content_hash`, so that manim reuses it
+    # whenever the state going into the call is the same as in an earlier render
+    import manim.renderer.cairo_renderer
+    import manim.utils.hashing
+    manim.utils.hashing.get_hash_from_play_call = content_hash
+    manim.renderer.cairo_renderer.get_hash_from_play_call = content_hash
+
+def record_cache_use ( scene ):
+    # hook: records for every play call whether manim found its partial movie in the cache
+    file_writer = scene.renderer.file_writer
+    is_already_cached = file_writer.is_already_cached
+    plays = [ ]
+    def recording_is_already_cached ( hash_invocation: str ) -> bool:
+        cached = is_already_cached ( hash_invocation )
+        plays.append ( { "play": scene.renderer.num_plays, "hash": hash_invocation, "cached": cached } )
+        return cached
+    file_writer.is_already_cached = recording_is_already_cached
+    return lambda: { "cache": plays }
+
+def report_cache_use ( result: RenderResult ):
+    plays = result.extra.get ( "cache", [ ] )
+    if not plays: return
+    hits = sum ( play [ "cached" ] for play in plays )
+    changed = ", ".join ( str ( play [ "play" ] ) for play in plays if not play [ "cached" ] ) or "none"
+    print ( f"{result.name}: {hits}/{len ( plays )} play(s) reused from the cache, rendered: {changed}" )
@@ -0,0 +1,82 @@
+import json
+import sys
+from functools import partial
+from pathlib import Path
+
+from .jobs import RenderJob
+
+# manim config of a dry run: nothing is written and no hash is computed
+DRY_RUN_CONFIG = {
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "disable_caching": True,
+}
+
+def _construct_locals ( scene ) -> dict:
+    # the local variables of the running `construct`, found on the call stack
+    code = type ( scene ).construct.__code__
+    frame = sys._getframe ( 1 )
+    while frame is not None:
+        if frame.f_code is code and frame.f_locals.get ( "self" ) is scene: return frame.f_locals
+        frame = frame.f_back
+    return { }
+
+def _state ( value ):
+    # value trackers and numbers as their value, other mobjects as their centre, arrays as lists
+    from manim import Mobject
+    if isinstance ( value, Mobject ):
+        value = value.get_value ( ) if hasattr ( value, "get_value" ) else value.get_center ( )
+    if hasattr ( value, "tolist" ): value = value.tolist ( )
+    if isinstance ( value, ( int, float ) ) and not isinstance ( value, bool ): return round ( value, 5 )
+    if isinstance ( value, list ): return [ _state ( item ) for item in value ]
+    return None
+
+def dry_run ( scene, track: list [ str ] | None = None ):
+    # hook: runs the scene frame by frame without drawing or encoding anything,
+    # and writes the state of the `track`ed variables of `construct` ( all mobjects if none )
+    # after every frame to `<media dir>/dryrun/<output name>.jsonl`
+    from manim import Mobject, config
+    track = list ( track or [ ] )
+    renderer = scene.renderer
+    path = Path ( config.media_dir ) / "dryrun" / f"{config.output_file or type ( scene ).__name__}.jsonl"
+    path.parent.mkdir ( parents = True, exist_ok = True )
+    output = open ( path, "w", encoding = "utf-8" )
+    output.write ( json.dumps ( { "scene": type ( scene ).__name__, "fps": config.frame_rate, "track": track } ) + "\n" )
+    frames = 0
+
+    def record ( count: int = 1 ):
+        nonlocal frames
+        if count < 1: return
+        local = _construct_locals ( scene )
+        names = track or [ name for name, value in local.items ( ) if isinstance ( value, Mobject ) ]
+        values = { name: _state ( local [ name ] ) for name in names if name in local }
+        output.write ( json.dumps ( { 
+            "frame": frames, 
+            "play": renderer.num_plays, 
+            "time": round ( frames / config.frame_rate, 5 ), 
+            "values": values, 
+            **( { "repeat": count } if count > 1 else { } ),
+        }, separators = ( ",", ":" ) ) + "\n" )
+        frames += count
+
+    # the renderer keeps running the scene, but every frame is recorded instead of drawn
+    def render ( scene, time, moving_mobjects ):
+        record ( )
+    def freeze_current_frame ( duration: float ):
+        record ( int ( duration * config.frame_rate ) )
+
+    renderer.render = render
+    renderer.freeze_current_frame = freeze_current_frame
+    renderer.update_frame = lambda *args, **kwargs: None
+    renderer.save_static_frame_data = lambda *args, **kwargs: None
+
+    def collect ( ) -> dict:
+        output.close ( )
+        return { "frames": frames, "dry_run": str ( path ) }
+    return collect
+
+def dry_run_jobs ( scenes: list [ str ], config: dict, track: list [ str ] ) -> list [ RenderJob ]:
+    return [ 
+        RenderJob ( name, config = { **config, **DRY_RUN_CONFIG }, hooks = [ partial ( dry_run, track = track ) ] ) 
+        for name in scenes 
+    ]
@@ -0,0 +1,157 @@
+import importlib.util
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .scenes import scene_file
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+@dataclass
+class RenderJob:
+    scene: str
+    params: dict = field ( default_factory = dict )
+    # manim config overrides, e.g. `{ "quality": "low_quality" }`
+    config: dict = field ( default_factory = dict )
+    # name of the output file and the log, defaults to the scene name
+    name: str | None = None
+    # module-level functions `hook ( scene )`, called after the scene is built and before it renders
+    # a hook may return a function, whose result ( a dict ) is merged into `RenderResult.extra` afterwards
+    hooks: list = field ( default_factory = list )
+
+    def __post_init__ ( self ):
+        if self.name is None: self.name = self.scene
+
+@dataclass
+class RenderResult:
+    name: str
+    scene: str
+    status: str
+    seconds: float
+    log: str
+    output: str | None = None
+    error: str | None = None
+    extra: dict = field ( default_factory = dict )
+
+def worker_context ( ) -> multiprocessing.context.BaseContext:
+    # where the platform has it, worker processes are forked from a server process that has imported manim
+    # once, so that a fresh worker starts in milliseconds instead of importing manim again; elsewhere they are spawned
+    if "forkserver" not in multiprocessing.get_all_start_methods ( ): return multiprocessing.get_context ( "spawn" )
+    context = multiprocessing.get_context ( "forkserver" )
+    context.set_forkserver_preload ( [ "manim", "tools.jobs" ] )
+    return context
+
+def load_scene ( name: str ):
+    # imports the scene the way `manim` does, with the directory of its file on `sys.path`
+    file = scene_file ( name )
+    module_name = f"{file.parent.name}.{file.stem}"
+    module = sys.modules.get ( module_name )
+    if module is None:
+        spec = importlib.util.spec_from_file_location ( module_name, file )
+        module = importlib.util.module_from_spec ( spec )
+        sys.modules [ module_name ] = module
+        sys.path.insert ( 0, str ( file.parent ) )
+        spec.loader.exec_module ( module )
+    return getattr ( module, name )
+
+def resolve_params ( params: dict ) -> dict:
+    # strings naming a manim rate function are replaced by the function,
+    # so that easings can be given on the command line
+    from manim.utils import rate_functions
+    return { 
+        key: getattr ( rate_functions, value ) 
+            if isinstance ( value, str ) and callable ( getattr ( rate_functions, value, None ) ) 
+            else value
+        for key, value in params.items ( )
+    }
+
+def render ( job: RenderJob, log_dir: Path ) -> RenderResult:
+    # runs in a worker process; everything the render prints goes to the job's log file
+    log_path = log_dir / f"{job.name}.log"
+    start = time.perf_counter ( )
+    result = RenderResult ( job.name, job.scene, "failed", 0.0, str ( log_path ) )
+    with open ( log_path, "w", encoding = "utf-8" ) as log, redirect_stdout ( log ), redirect_stderr ( log ):
+        handler = logging.StreamHandler ( log )
+        try:
+            from manim import logger, tempconfig
+            logger.addHandler ( handler )
+            scene_class = load_scene ( job.scene )
+            with tempconfig ( {
+                "input_file": str ( scene_file ( job.scene ) ),
+                "output_file": job.name,
+                "progress_bar": "none",
+                **job.config,
+            } ):
+                scene = scene_class ( **resolve_params ( job.params ) )
+                collectors = [ hook ( scene ) for hook in job.hooks ]
+                scene.render ( )
+                for collect in collectors:
+                    if collect is not None: result.extra.update ( collect ( ) )
+                movie = scene.renderer.file_writer.movie_file_path
+                result.output = str ( movie ) if movie else None
+            result.status = "ok"
+        except Exception as e:
+            traceback.print_exc ( )
+            result.error = f"{type ( e ).__name__}: {e}"
+    result.seconds = time.perf_counter ( ) - start
+    return result
+
+def run_jobs ( 
+        jobs: list [ RenderJob ], 
+        media_dir: Path, 
+        workers: int | None = None,
+        manifest_name: str | None = "render_manifest.json",
+) -> list [ RenderResult ]:
+    # renders `jobs` on a pool of worker processes, one fresh process per job so that
+    # manim's global config and scene state never leak from one job into the next
+    # all jobs share `media_dir`, and with it manim's Tex and text caches
+    media_dir = Path ( media_dir ).resolve ( )
+    log_dir = media_dir / "logs"
+    log_dir.mkdir ( parents = True, exist_ok = True )
+    workers = min ( workers or os.cpu_count ( ) or 1, len ( jobs ) ) or 1
+    for job in jobs: job.config.setdefault ( "media_dir", str ( media_dir ) )
+
+    def report ( result: RenderResult ):
+        results.append ( result )
+        print ( f"[{result.status:>6}] {result.name} ({result.seconds:.1f}s)", flush = True )
+        if result.error: print ( f"         {result.error}, see {result.log}", flush = True )
+
+    start = time.perf_counter ( )
+    results = [ ]
+    with ProcessPoolExecutor ( 
+        max_workers = workers, 
+        mp_context = worker_context ( ), 
+        max_tasks_per_child = 1,
+    ) as pool:
+        futures = [ pool.submit ( render, job, log_dir ) for job in jobs ]
+        for future in as_completed ( futures ): report ( future.result ( ) )
+
+    order = { job.name: i for i, job in enumerate ( jobs ) }
+    results.sort ( key = lambda result: order [ result.name ] )
+    if manifest_name is None: return results
+    manifest = {
+        "workers": workers,
+        "seconds": time.perf_counter ( ) - start,
+        "outputs": [ result.output for result in results if result.status == "ok" ],
+        "failures": [ result.name for result in results if result.status != "ok" ],
+        "results": [ asdict ( result ) for result in results ],
+    }
+    manifest_path = media_dir / manifest_name
+    manifest_path.write_text ( json.dumps ( manifest, indent = 4 ), encoding = "utf-8" )
+    print ( f"rendered {len ( results ) - len ( manifest [ 'failures' ] )}/{len ( results )} "
+            f"in {manifest [ 'seconds' ]:.1f}s, manifest written to {manifest_path}" )
+    return results
@@ -0,0 +1,183 @@
+import atexit
+import multiprocessing
+import queue
+import subprocess
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# frames in flight between the renderer and the encoder
+RING_SLOTS = 4
+
+def _encode ( shm_name: str, frame_bytes: int, slots: int, free, requests, replies ):
+    # runs in the encoder process: streams the frames named by `requests` from the ring buffer to ffmpeg,
+    # and gives each slot back to the renderer as soon as ffmpeg has read it
+    ring = shared_memory.SharedMemory ( name = shm_name )
+    frames = [ ring.buf [ i * frame_bytes: ( i + 1 ) * frame_bytes ] for i in range ( slots ) ]
+    process, broken = None, False
+    try:
+        while True:
+            request, argument = requests.get ( )
+            if request == "frame":
+                # a slot is always given back, even if ffmpeg failed, so that the renderer never waits forever
+                try:
+                    if not broken: process.stdin.write ( frames [ argument ] )
+                except OSError:
+                    broken = True
+                free.release ( )
+            elif request == "open":
+                process, broken = subprocess.Popen ( argument, stdin = subprocess.PIPE ), False
+            elif request == "close":
+                try:
+                    process.stdin.close ( )
+                except OSError:
+                    broken = True
+                returncode = process.wait ( )
+                replies.put ( ( argument, ( returncode or -1 ) if broken else returncode ) )
+                process = None
+            else:
+                break
+    finally:
+        if process is not None: process.kill ( )
+        for frame in frames: frame.release ( )
+        ring.close ( )
+
+class FrameRing:
+    # a ring of frame buffers in shared memory, drawn into by the camera and encoded by another process
+    # the camera draws straight into the current slot, and writing a frame only sends its slot number;
+    # when every slot is waiting to be encoded, writing blocks until the encoder frees the oldest one
+    def __init__ ( self, shape: tuple, slots: int = RING_SLOTS ):
+        self.frame_bytes = int ( np.prod ( shape ) )
+        self.shm = shared_memory.SharedMemory ( create = True, size = self.frame_bytes * slots )
+        # one view per slot, kept for the whole render, since the camera caches a cairo context per array
+        self.frames = [
+            np.ndarray ( shape, np.uint8, self.shm.buf, offset = i * self.frame_bytes ) for i in range ( slots )
+        ]
+        context = multiprocessing.get_context ( "spawn" )
+        self.free = context.Semaphore ( slots - 1 )
+        self.requests, self.replies = context.Queue ( ), context.Queue ( )
+        self.encoder = context.Process (
+            target = _encode,
+            args = ( self.shm.name, self.frame_bytes, slots, self.free, self.requests, self.replies ),
+            daemon = True,
+        )
+        self.encoder.start ( )
+        self.slot = 0
+        self.pending: list [ str ] = [ ]
+        atexit.register ( self.stop )
+
+    @property
+    def current ( self ) -> np.ndarray:
+        return self.frames [ self.slot ]
+
+    def publish ( self ) -> np.ndarray:
+        # queues the current slot for encoding and returns the next one, once it is free
+        self.requests.put ( ( "frame", self.slot ) )
+        while not self.free.acquire ( timeout = 1 ):
+            if not self.encoder.is_alive ( ): raise RuntimeError ( "the encoder process exited" )
+        self.slot = ( self.slot + 1 ) % len ( self.frames )
+        return self.current
+
+    def open ( self, command: list [ str ] ):
+        self.requests.put ( ( "open", command ) )
+
+    def close ( self, name: str ):
+        self.requests.put ( ( "close", name ) )
+        self.pending.append ( name )
+
+    def drain ( self ):
+        # waits until every movie opened so far is completely encoded
+        while self.pending:
+            while True:
+                try:
+                    name, returncode = self.replies.get ( timeout = 1 )
+                    break
+                except queue.Empty:
+                    if not self.encoder.is_alive ( ): raise RuntimeError ( "the encoder process exited" )
+            self.pending.remove ( name )
+            if returncode != 0: raise RuntimeError ( f"ffmpeg exited with status {returncode} while writing {name}" )
+
+    def stop ( self ):
+        if self.shm is None: return
+        if self.encoder.is_alive ( ):
+            self.requests.put ( ( "stop", None ) )
+            self.encoder.join ( timeout = 10 )
+        self.frames.clear ( )
+        try:
+            self.shm.close ( )
+        except BufferError:
+            # an array still points into the ring; the memory is released when the process exits
+            pass
+        self.shm.unlink ( )
+        self.shm = None
+
+class _RemoteMovie:
+    # stands in for the ffmpeg process of one partial movie, which runs in the encoder process
+    def __init__ ( self, ring: FrameRing, command: list [ str ] ):
+        self.ring, self.name = ring, command [ -1 ]
+        self.stdin = self
+        ring.open ( command )
+
+    def close ( self ):
+        self.ring.close ( self.name )
+
+    def wait ( self ) -> int:
+        # the movie is finished in the background while the next play call renders,
+        # `FrameRing.drain` waits for it before the partial movies are combined
+        return 0
+
+    def terminate ( self ):
+        self.ring.stop ( )
+
+class _SubprocessShim:
+    # `subprocess` as seen by manim's file writer: the raw video pipes go to the encoder process
+    def __init__ ( self, ring: FrameRing ):
+        self.ring = ring
+
+    def Popen ( self, command, *args, **kwargs ):
+        if kwargs.get ( "stdin" ) == subprocess.PIPE and "rawvideo" in command:
+            return _RemoteMovie ( self.ring, list ( map ( str, command ) ) )
+        return subprocess.Popen ( command, *args, **kwargs )
+
+    def __getattr__ ( self, name: str ):
+        return getattr ( subprocess, name )
+
+def pipelined_encoding ( scene ):
+    # hook: renders and encodes at the same time, through a `FrameRing` shared with an encoder process
+    from manim import config
+    from manim.constants import RendererType
+    from manim.scene import scene_file_writer
+    from manim.utils.file_ops import is_png_format, write_to_movie
+    if not write_to_movie ( ) or is_png_format ( ) or config.renderer != RendererType.CAIRO: return None
+
+    renderer, camera, file_writer = scene.renderer, scene.renderer.camera, scene.renderer.file_writer
+    ring = FrameRing ( camera.pixel_array.shape )
+    ring.current [ ... ] = camera.pixel_array
+    camera.pixel_array = ring.current
+    scene_file_writer.subprocess = _SubprocessShim ( ring )
+
+    def render ( scene, time, moving_mobjects ):
+        # the frame is handed over in place, instead of the copy `get_frame` makes
+        renderer.update_frame ( scene, moving_mobjects )
+        renderer.add_frame ( camera.pixel_array )
+    def write_frame ( frame: np.ndarray ):
+        # frames that were not drawn into the ring ( frozen frames ) are copied into it first
+        if frame is not ring.current: np.copyto ( ring.current, frame )
+        camera.pixel_array = ring.publish ( )
+    renderer.render = render
+    file_writer.write_frame = write_frame
+
+    for name in ( "combine_to_movie", "combine_to_section_videos" ):
+        def draining ( combine = getattr ( file_writer, name ) ):
+            ring.drain ( )
+            return combine ( )
+        setattr ( file_writer, name, draining )
+
+    def collect ( ) -> dict:
+        ring.drain ( )
+        # the camera lets go of the ring before it is freed
+        camera.pixel_array = np.array ( camera.pixel_array )
+        camera.pixel_array_to_cairo_context = { }
+        ring.stop ( )
+        return { "pipeline_slots": len ( ring.frames ) }
+    return collect
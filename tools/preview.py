@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+from .cache import record_cache_use, report_cache_use
+from .jobs import RenderJob, RenderResult, run_jobs
+from .scenes import ROOT
+
+PREVIEW_FPS = 10
+
+def _with_cache_report ( hooks: list ) -> list:
+    return hooks if record_cache_use in hooks else [ *hooks, record_cache_use ]
+
+def preview_job ( job: RenderJob, fps: int = PREVIEW_FPS, open_movie: bool = True ) -> RenderJob:
+    # the same scene at low resolution and frame rate, written next to the full quality movie
+    return replace ( 
+        job,
+        name = f"{job.name}.preview",
+        config = { **job.config, "quality": "low_quality", "frame_rate": fps, "preview": open_movie },
+        hooks = _with_cache_report ( job.hooks ),
+    )
+
+def refine ( job: RenderJob, media_dir: Path ) -> RenderResult:
+    [ result ] = run_jobs ( 
+        [ replace ( job, hooks = _with_cache_report ( job.hooks ) ) ], 
+        media_dir, 1, f"refine_{job.name}.json",
+    )
+    report_cache_use ( result )
+    return result
+
+def refine_in_background ( argv: list [ str ], log: Path ) -> subprocess.Popen:
+    # runs `python -m tools <argv>` detached from this process, so that it keeps running after we exit
+    log.parent.mkdir ( parents = True, exist_ok = True )
+    detach = { "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP } \
+        if os.name == "nt" else { "start_new_session": True }
+    with open ( log, "w", encoding = "utf-8" ) as output:
+        return subprocess.Popen ( 
+            [ sys.executable, "-m", "tools", *argv ], 
+            cwd = ROOT, stdin = subprocess.DEVNULL, stdout = output, stderr = subprocess.STDOUT,
+            **detach,
+        )
+
+def preview ( job: RenderJob, media_dir: Path, fps: int, open_movie: bool, refine_argv: list [ str ] ) -> int:
+    # renders the preview, then starts the full quality render in the background and returns at once
+    [ result ] = run_jobs ( [ preview_job ( job, fps, open_movie ) ], media_dir, 1, manifest_name = None )
+    report_cache_use ( result )
+    log = Path ( media_dir ) / "logs" / f"{job.name}.refine.log"
+    process = refine_in_background ( refine_argv, log )
+    print ( f"refining {job.name} in the background ( pid {process.pid} ), see {log}" )
+    return int ( result.status != "ok" )
@@ -0,0 +1,137 @@
+import functools
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+def _updater_name ( function, frame ) -> str:
+    # the name the updater has in the code that registered it, e.g. `trace_dot_updater`,
+    # falling back to its qualified name and line for anonymous lambdas
+    for name, value in frame.f_locals.items ( ):
+        if value is function: return name
+    code = getattr ( function, "__code__", None )
+    line = f":{code.co_firstlineno}" if code is not None else ""
+    return f"{getattr ( function, '__qualname__', repr ( function ) )}{line}"
+
+def _summary ( durations: list [ int ] ) -> dict:
+    # durations in nanoseconds; buckets are powers of two microseconds, keyed by their upper bound
+    ordered = sorted ( durations )
+    histogram = { }
+    for duration in ordered:
+        bound = 1 << max ( 0, ( duration // 1000 ) ).bit_length ( )
+        histogram [ bound ] = histogram.get ( bound, 0 ) + 1
+    quantile = lambda q: ordered [ min ( len ( ordered ) - 1, int ( q * len ( ordered ) ) ) ] / 1000
+    return {
+        "calls": len ( ordered ),
+        "total_ms": sum ( ordered ) / 1e6,
+        "mean_us": sum ( ordered ) / len ( ordered ) / 1000,
+        "p50_us": quantile ( 0.5 ),
+        "p95_us": quantile ( 0.95 ),
+        "max_us": ordered [ -1 ] / 1000,
+        "histogram_us": { f"<{bound}": count for bound, count in histogram.items ( ) },
+    }
+
+class UpdaterProfile:
+    # times every call of every updater registered with `add_updater` while installed,
+    # labelled by the mobject it updates and by the play call it runs in
+    def __init__ ( self ):
+        self.events: list [ tuple ] = [ ]
+        self.plays: list [ tuple [ str, int, int ] ] = [ ]
+        self.play = "setup"
+        self.__origin = time.perf_counter_ns ( )
+
+    def wrap ( self, mobject, function, name: str ):
+        label = f"{type ( mobject ).__name__}#{id ( mobject ):x}"
+        # `functools.wraps` keeps the signature visible to manim, which passes `dt` only to updaters that take it
+        @functools.wraps ( function )
+        def timed ( *args, **kwargs ):
+            start = time.perf_counter_ns ( )
+            try:
+                return function ( *args, **kwargs )
+            finally:
+                self.events.append ( ( name, label, self.play, start, time.perf_counter_ns ( ) - start ) )
+        timed.profile = self
+        return timed
+
+    def install ( self, scene ):
+        from manim import Mobject
+        profile = self
+        add_updater, remove_updater = Mobject.add_updater, Mobject.remove_updater
+
+        def timed_add_updater ( self, update_function, *args, **kwargs ):
+            if getattr ( update_function, "profile", None ) is not profile:
+                name = _updater_name ( update_function, sys._getframe ( 1 ) )
+                update_function = profile.wrap ( self, update_function, name )
+            return add_updater ( self, update_function, *args, **kwargs )
+
+        def timed_remove_updater ( self, update_function ):
+            for updater in list ( self.updaters ):
+                if getattr ( updater, "profile", None ) is profile and updater.__wrapped__ is update_function:
+                    remove_updater ( self, updater )
+            return remove_updater ( self, update_function )
+
+        Mobject.add_updater, Mobject.remove_updater = timed_add_updater, timed_remove_updater
+
+        play = scene.play
+        def labelled_play ( *args, **kwargs ):
+            index = len ( self.plays )
+            names = ", ".join ( type ( arg ).__name__ for arg in args ) or "wait"
+            self.play = f"play {index}: {names}"
+            start = time.perf_counter_ns ( )
+            try:
+                return play ( *args, **kwargs )
+            finally:
+                self.plays.append ( ( self.play, start, time.perf_counter_ns ( ) - start ) )
+                self.play = f"after play {index}"
+        scene.play = labelled_play
+
+    def trace ( self ) -> dict:
+        # Chrome trace event format, opens in chrome://tracing and ui.perfetto.dev
+        pid = os.getpid ( )
+        us = lambda ns: ( ns - self.__origin ) / 1000
+        threads = { }
+        events = [ 
+            { "name": play, "cat": "play", "ph": "X", "ts": us ( start ), "dur": duration / 1000, "pid": pid, "tid": 0 }
+            for play, start, duration in self.plays
+        ]
+        for name, mobject, play, start, duration in self.events:
+            tid = threads.setdefault ( name, len ( threads ) + 1 )
+            events.append ( { 
+                "name": name, "cat": "updater", "ph": "X", "ts": us ( start ), "dur": duration / 1000, 
+                "pid": pid, "tid": tid, "args": { "mobject": mobject, "play": play },
+            } )
+        names = [ ( 0, "plays" ), *( ( tid, name ) for name, tid in threads.items ( ) ) ]
+        events += [ 
+            { "name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": { "name": name } } 
+            for tid, name in names
+        ]
+        return { "traceEvents": events, "displayTimeUnit": "ms" }
+
+    def summary ( self ) -> dict:
+        # timing statistics per updater, and per updater and play call, the slowest updaters first
+        by_updater, by_play = { }, { }
+        for name, mobject, play, _, duration in self.events:
+            by_updater.setdefault ( f"{name} [{mobject}]", [ ] ).append ( duration )
+            by_play.setdefault ( name, { } ).setdefault ( play, [ ] ).append ( duration )
+        ranked = sorted ( by_updater.items ( ), key = lambda item: -sum ( item [ 1 ] ) )
+        return {
+            "updaters": { name: _summary ( durations ) for name, durations in ranked },
+            "plays": { 
+                name: { play: sum ( durations ) / 1e6 for play, durations in plays.items ( ) }
+                for name, plays in by_play.items ( )
+            },
+        }
+
+def profile_updaters ( scene ):
+    # hook: writes a trace of all updater calls to `<media dir>/profiles/<output name>.trace.json`
+    # and adds the per-updater statistics ( in milliseconds and microseconds ) to the render result
+    from manim import config
+    profile = UpdaterProfile ( )
+    profile.install ( scene )
+    def collect ( ) -> dict:
+        path = Path ( config.media_dir ) / "profiles" / f"{config.output_file or type ( scene ).__name__}.trace.json"
+        path.parent.mkdir ( parents = True, exist_ok = True )
+        path.write_text ( json.dumps ( profile.trace ( ) ), encoding = "utf-8" )
+        return { "updater_trace": str ( path ), **profile.summary ( ) }
+    return collect
@@ -0,0 +1,176 @@
+import ast
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+ROOT = Path ( __file__ ).resolve ( ).parent.parent
+# the index of every scene, rebuilt for the files that changed since it was written
+INDEX = ROOT / "media" / "scene_index.json"
+INDEX_VERSION = 1
+
+# manim's scene classes; any class of the project that derives from one of them is a scene
+_MANIM_SCENES = {
+    "Scene", "ThreeDScene", "SpecialThreeDScene", "MovingCameraScene", "ZoomedScene",
+    "VectorScene", "LinearTransformationScene",
+}
+# directories that never hold scenes
+_SKIPPED = { "tools", "media", "benchmarks", "venv", "__pycache__" }
+
+@dataclass
+class Parameter:
+    name: str
+    # source text of the annotation and the default value, as written
+    annotation: str | None = None
+    default: str | None = None
+
+    def __str__ ( self ) -> str:
+        text = self.name
+        if self.annotation is not None: text += f": {self.annotation}"
+        if self.default is not None: text += f" = {self.default}" if self.annotation is not None else f"={self.default}"
+        return text
+
+@dataclass
+class SceneInfo:
+    name: str
+    # relative to `ROOT`
+    file: str
+    line: int
+    bases: list [ str ] = field ( default_factory = list )
+    # the parameters of `__init__`, inherited from the first base of the project that defines one;
+    # None when only manim's `__init__` is used
+    parameters: list [ Parameter ] | None = None
+
+    @property
+    def path ( self ) -> Path:
+        return ROOT / self.file
+
+    def check_params ( self, params: dict ):
+        # raises if the scene cannot be built with `params` as keyword arguments
+        names = { parameter.name for parameter in self.parameters or [ ] }
+        unknown = [ key for key in params if key not in names ]
+        if unknown:
+            expected = ", ".join ( sorted ( names ) ) or "no arguments"
+            raise ValueError ( f"`{self.name}` does not take {', '.join ( unknown )}, it takes {expected}" )
+
+def _name ( node: ast.expr ) -> str | None:
+    if isinstance ( node, ast.Name ): return node.id
+    if isinstance ( node, ast.Attribute ): return node.attr
+    return None
+
+def _parameters ( function: ast.FunctionDef ) -> list [ Parameter ]:
+    # keyword-passable parameters of `function` without `self`, with their defaults lined up from the right
+    arguments = function.args
+    positional = [ *arguments.posonlyargs, *arguments.args ] [ 1: ]
+    defaults = [ None ] * ( len ( positional ) - len ( arguments.defaults ) ) + list ( arguments.defaults )
+    return [
+        Parameter (
+            argument.arg,
+            ast.unparse ( argument.annotation ) if argument.annotation else None,
+            ast.unparse ( default ) if default is not None else None,
+        )
+        for argument, default in [ *zip ( positional, defaults ), *zip ( arguments.kwonlyargs, arguments.kw_defaults ) ]
+    ]
+
+def scan ( file: Path ) -> list [ dict ]:
+    # every module-level class of `file`, found without importing it
+    tree = ast.parse ( Path ( file ).read_text ( encoding = "utf-8" ), str ( file ) )
+    classes = [ ]
+    for node in tree.body:
+        if not isinstance ( node, ast.ClassDef ): continue
+        init = next ( (
+            item for item in node.body
+            if isinstance ( item, ast.FunctionDef ) and item.name == "__init__"
+        ), None )
+        classes.append ( {
+            "name": node.name,
+            "line": node.lineno,
+            "bases": [ name for name in map ( _name, node.bases ) if name is not None ],
+            "parameters": [ asdict ( parameter ) for parameter in _parameters ( init ) ] if init else None,
+        } )
+    return classes
+
+def _source_files ( ) -> list [ Path ]:
+    files = [ ]
+    for directory, directories, names in os.walk ( ROOT ):
+        directories [ : ] = [ name for name in directories if name not in _SKIPPED and not name.startswith ( "." ) ]
+        files += [ Path ( directory ) / name for name in names if name.endswith ( ".py" ) ]
+    return sorted ( files )
+
+def _load_index ( ) -> dict:
+    try:
+        index = json.loads ( INDEX.read_text ( encoding = "utf-8" ) )
+        if index.get ( "version" ) == INDEX_VERSION: return index [ "files" ]
+    except ( OSError, ValueError ):
+        pass
+    return { }
+
+def _save_index ( files: dict ):
+    # written under a temporary name first, so that parallel workers never read half an index
+    try:
+        INDEX.parent.mkdir ( parents = True, exist_ok = True )
+        temporary = INDEX.with_suffix ( f".{os.getpid ( )}.tmp" )
+        temporary.write_text ( json.dumps ( { "version": INDEX_VERSION, "files": files }, indent = 1 ), encoding = "utf-8" )
+        os.replace ( temporary, INDEX )
+    except OSError:
+        pass
+
+def _scan_all ( ) -> dict:
+    # the classes of every source file, from the index where the file's size and modification time still match
+    cached, files = _load_index ( ), { }
+    for file in _source_files ( ):
+        key = file.relative_to ( ROOT ).as_posix ( )
+        stat = file.stat ( )
+        entry = cached.get ( key )
+        if entry is None or entry [ "mtime_ns" ] != stat.st_mtime_ns or entry [ "size" ] != stat.st_size:
+            try:
+                classes = scan ( file )
+            except ( SyntaxError, UnicodeDecodeError ):
+                classes = [ ]
+            entry = { "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "classes": classes }
+        files [ key ] = entry
+    if files != cached: _save_index ( files )
+    return files
+
+_scenes: dict [ str, SceneInfo ] | None = None
+
+def scenes ( ) -> dict [ str, SceneInfo ]:
+    # every scene of the project by name, in the order of their files and lines
+    global _scenes
+    if _scenes is not None: return _scenes
+    files = _scan_all ( )
+    classes = { item [ "name" ]: item for entry in files.values ( ) for item in entry [ "classes" ] }
+
+    def is_scene ( name: str, seen: frozenset = frozenset ( ) ) -> bool:
+        if name in _MANIM_SCENES: return True
+        if name not in classes or name in seen: return False
+        return any ( is_scene ( base, seen | { name } ) for base in classes [ name ] [ "bases" ] )
+
+    def parameters ( name: str, seen: frozenset = frozenset ( ) ) -> list [ Parameter ] | None:
+        if name not in classes or name in seen: return None
+        item = classes [ name ]
+        if item [ "parameters" ] is not None: return [ Parameter ( **parameter ) for parameter in item [ "parameters" ] ]
+        return next ( (
+            found for found in ( parameters ( base, seen | { name } ) for base in item [ "bases" ] )
+            if found is not None
+        ), None )
+
+    found = { }
+    for file, entry in files.items ( ):
+        for item in entry [ "classes" ]:
+            name = item [ "name" ]
+            if name in _MANIM_SCENES or not is_scene ( name ): continue
+            if name in found:
+                raise ValueError ( f"scene `{name}` is defined in both {found [ name ].file} and {file}" )
+            found [ name ] = SceneInfo ( name, file, item [ "line" ], item [ "bases" ], parameters ( name ) )
+    _scenes = found
+    return found
+
+def scene_info ( name: str ) -> SceneInfo:
+    try:
+        return scenes ( ) [ name ]
+    except KeyError:
+        raise ValueError ( f"unknown scene `{name}`, expected one of {', '.join ( scenes ( ) )}" ) from None
+
+def scene_file ( name: str ) -> Path:
+    return scene_info ( name ).path
@@ -0,0 +1,98 @@
+import shutil
+import subprocess
+from dataclasses import replace
+from pathlib import Path
+
+from .jobs import RenderJob, RenderResult, run_jobs
+
+def record_durations ( scene ):
+    # hook: records the run time of every `self.play` / `self.wait` call
+    durations = [ ]
+    play = scene.renderer.play
+    def recording_play ( *args, **kwargs ):
+        play ( *args, **kwargs )
+        durations.append ( scene.duration )
+    scene.renderer.play = recording_play
+    return lambda: { "durations": durations }
+
+def plan ( job: RenderJob, media_dir: Path ) -> list [ float ]:
+    # runs the whole scene with every animation skipped, which updates the scene state
+    # but renders no frame, to find out how many play calls there are and how long each one is
+    planning = replace ( 
+        job,
+        name = f"{job.name}.plan",
+        config = { 
+            **job.config, 
+            "from_animation_number": 10 ** 9, 
+            "write_to_movie": False, 
+            "save_last_frame": False,
+        },
+        hooks = [ *job.hooks, record_durations ],
+    )
+    [ result ] = run_jobs ( [ planning ], media_dir, 1, manifest_name = None )
+    if result.status != "ok": raise RuntimeError ( f"planning {job.name} failed: {result.error}" )
+    return result.extra [ "durations" ]
+
+def partition ( durations: list [ float ], count: int ) -> list [ tuple [ int, int ] ]:
+    # splits the play calls into at most `count` contiguous ranges `[ start, end )` of similar total run time
+    count = max ( 1, min ( count, len ( durations ) ) )
+    total = sum ( durations )
+    ranges, start, elapsed = [ ], 0, 0.0
+    for i, duration in enumerate ( durations ):
+        elapsed += duration
+        remaining_ranges = count - len ( ranges ) - 1
+        remaining_plays = len ( durations ) - i - 1
+        if remaining_ranges and remaining_plays and (
+            elapsed >= total * ( len ( ranges ) + 1 ) / count or remaining_plays == remaining_ranges
+        ):
+            ranges.append ( ( start, i + 1 ) )
+            start = i + 1
+    ranges.append ( ( start, len ( durations ) ) )
+    # manim treats `upto_animation_number = 0` as "no limit", so the first range needs 2 plays at least
+    if len ( ranges ) > 1 and ranges [ 0 ] [ 1 ] == 1:
+        ranges [ 0 ] = ( 0, 2 )
+        if ranges [ 1 ] [ 1 ] == 2: del ranges [ 1 ]
+        else: ranges [ 1 ] = ( 2, ranges [ 1 ] [ 1 ] )
+    return ranges
+
+def segment_jobs ( job: RenderJob, ranges: list [ tuple [ int, int ] ], media_dir: Path ) -> list [ RenderJob ]:
+    # every segment fast-forwards through the plays before its range without rendering them
+    # ( manim's `-n` option ), and has its own partial movie directory so that workers never share files
+    return [
+        replace ( 
+            job,
+            name = f"{job.name}.part{i:03}",
+            config = {
+                **job.config,
+                "from_animation_number": start,
+                "upto_animation_number": end - 1,
+                "partial_movie_dir": str ( media_dir / "segments" / job.name / f"{i:03}" ),
+            },
+        )
+        for i, ( start, end ) in enumerate ( ranges )
+    ]
+
+def stitch ( files: list [ str ], output: Path ) -> Path:
+    ffmpeg = shutil.which ( "ffmpeg" )
+    if ffmpeg is None: raise RuntimeError ( "ffmpeg is needed to stitch the segments together" )
+    listing = output.with_suffix ( ".segments.txt" )
+    listing.write_text ( "".join ( f"file '{Path ( file ).as_posix ( )}'\n" for file in files ), encoding = "utf-8" )
+    subprocess.run ( 
+        [ ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str ( listing ), "-c", "copy", str ( output ) ],
+        check = True,
+    )
+    listing.unlink ( )
+    return output
+
+def render_segments ( job: RenderJob, media_dir: Path, workers: int ) -> tuple [ list [ RenderResult ], Path | None ]:
+    media_dir = Path ( media_dir ).resolve ( )
+    durations = plan ( job, media_dir )
+    ranges = partition ( durations, workers )
+    print ( f"{job.name}: {len ( durations )} plays, {sum ( durations ):.1f}s, split into", 
+            ", ".join ( f"{start}-{end - 1}" for start, end in ranges ) )
+    results = run_jobs ( segment_jobs ( job, ranges, media_dir ), media_dir, workers, f"segments_{job.name}.json" )
+    if any ( result.status != "ok" for result in results ): return results, None
+    files = [ result.output for result in results ]
+    output = stitch ( files, Path ( files [ 0 ] ).with_name ( job.name + Path ( files [ 0 ] ).suffix ) )
+    print ( f"stitched {len ( files )} segments into {output}" )
+    return results, output
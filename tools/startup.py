@@ -0,0 +1,50 @@
+import importlib
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .jobs import worker_context
+from .scenes import scene_file
+
+_IMPORT_TIME = re.compile ( r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)" )
+
+def import_times ( code: str, cwd = None ) -> list [ tuple [ str, int, float, float ] ]:
+    # runs `code` in a fresh interpreter with `-X importtime`, and returns every import it made
+    # as ( module, nesting depth, own seconds, cumulative seconds ), in the order they finished
+    run = subprocess.run (
+        [ sys.executable, "-X", "importtime", "-c", code ],
+        cwd = cwd, capture_output = True, text = True,
+    )
+    if run.returncode != 0: raise RuntimeError ( run.stderr.strip ( ).splitlines ( ) [ -1 ] )
+    return [
+        ( name, len ( indent ) // 2, int ( own ) / 1e6, int ( cumulative ) / 1e6 )
+        for own, cumulative, indent, name in _IMPORT_TIME.findall ( run.stderr )
+    ]
+
+def _started ( ) -> float:
+    importlib.import_module ( "manim" )
+    return time.time ( )
+
+def worker_startup ( ) -> float:
+    # seconds from submitting a job to a fresh worker until it runs with manim imported,
+    # measured once the worker server ( if any ) is up, as every job but the first sees it
+    with ProcessPoolExecutor ( 1, mp_context = worker_context ( ), max_tasks_per_child = 1 ) as pool:
+        pool.submit ( _started ).result ( )
+        start = time.time ( )
+        return pool.submit ( _started ).result ( ) - start
+
+def report ( scenes: list [ str ], top: int = 12 ):
+    # prints where the time goes when a worker imports manim and the modules of `scenes`
+    files = sorted ( { scene_file ( name ) for name in scenes } )
+    for label, code, cwd in [
+        ( "manim", "import manim", None ),
+        *( ( f"{file.parent.name}/{file.name}", f"import {file.stem}", file.parent ) for file in files ),
+    ]:
+        imports = import_times ( code, cwd )
+        total = sum ( cumulative for _, depth, _, cumulative in imports if depth == 0 )
+        print ( f"{label}: {total:.2f}s" )
+        slowest = sorted ( ( item for item in imports if item [ 1 ] == 0 ), key = lambda item: -item [ 3 ] )
+        for name, _, _, cumulative in slowest [ :top ]: print ( f"    {cumulative:7.3f}s  {name}" )
+    print ( f"worker startup ( {worker_context ( ).get_start_method ( )} ): {worker_startup ( ):.2f}s" )
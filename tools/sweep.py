@@ -0,0 +1,52 @@
+import ast
+import hashlib
+import itertools
+import json
+import re
+from pathlib import Path
+
+from .jobs import RenderJob
+from .scenes import scene_info
+
+def parse_assignment ( text: str ) -> tuple [ str, list ]:
+    # `r1=2,3.5` -> ( "r1", [ 2, 3.5 ] ); values that are not python literals are kept as strings,
+    # so `easing=smooth,linear` names rate functions
+    key, sep, values = text.partition ( "=" )
+    if not sep or not key.isidentifier ( ):
+        raise ValueError ( f"expected `name=value,value,...`, got `{text}`" )
+    return key, [ parse_value ( value.strip ( ) ) for value in values.split ( "," ) ]
+
+def parse_value ( text: str ):
+    try:
+        return ast.literal_eval ( text )
+    except ( ValueError, SyntaxError ):
+        return text
+
+def parameter_sets ( assignments: list [ str ], params_file: str | None = None ) -> list [ dict ]:
+    # every combination of the `--set` grids, applied on top of every entry of `params_file`
+    base = json.loads ( Path ( params_file ).read_text ( ) ) if params_file else [ { } ]
+    if not isinstance ( base, list ) or not all ( isinstance ( entry, dict ) for entry in base ):
+        raise ValueError ( "the parameter file must contain a list of objects" )
+    grid = dict ( map ( parse_assignment, assignments ) )
+    combinations = [ dict ( zip ( grid, values ) ) for values in itertools.product ( *grid.values ( ) ) ]
+    return [ { **entry, **combination } for entry in base for combination in combinations ]
+
+def _format ( value ) -> str:
+    return f"{value:.6g}" if isinstance ( value, float ) else str ( value )
+
+def job_name ( scene: str, params: dict ) -> str:
+    # readable and deterministic: the same parameters always give the same name,
+    # and the hash keeps names unique when the formatted values collide
+    canonical = json.dumps ( params, sort_keys = True, default = repr )
+    digest = hashlib.sha1 ( canonical.encode ( ) ).hexdigest ( ) [ :8 ]
+    readable = "_".join ( f"{key}={_format ( params [ key ] )}" for key in sorted ( params ) )
+    readable = re.sub ( r"[^\w.=+-]", "-", readable )
+    return f"{scene}__{readable}__{digest}" if readable else scene
+
+def sweep_jobs ( scene: str, parameter_sets: list [ dict ], config: dict, hooks: list | None = None ) -> list [ RenderJob ]:
+    # argument names are checked against the scene index, before any worker starts
+    for params in parameter_sets: scene_info ( scene ).check_params ( params )
+    return [ 
+        RenderJob ( scene, params, dict ( config ), job_name ( scene, params ), list ( hooks or [ ] ) )
+        for params in parameter_sets
+    ]
@@ -0,0 +1,80 @@
+import ast
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .jobs import worker_context
+
+# classes that typeset every positional string argument, joined by their `arg_separator`
+_TEX_CLASSES = { "MathTex": " ", "Tex": "", "SingleStringMathTex": "" }
+# classes that typeset their numbers digit by digit with `MathTex`
+_NUMBER_CLASSES = { "DecimalNumber", "Integer", "Variable", "DecimalReadout" }
+_DIGITS = [ *"0123456789", ".", "-" ]
+
+def _name ( node: ast.expr ) -> str | None:
+    if isinstance ( node, ast.Name ): return node.id
+    if isinstance ( node, ast.Attribute ): return node.attr
+    return None
+
+def _string ( node: ast.expr ) -> str | None:
+    return node.value if isinstance ( node, ast.Constant ) and isinstance ( node.value, str ) else None
+
+def collect_tex ( file: Path ) -> set [ tuple [ str, str ] ]:
+    # finds, without running it, every `( class name, tex string )` that the source in `file`
+    # will typeset. only string literals can be found; strings built at runtime are compiled
+    # by the render itself as usual
+    items = set ( )
+    for node in ast.walk ( ast.parse ( Path ( file ).read_text ( encoding = "utf-8" ) ) ):
+        if not isinstance ( node, ast.Call ): continue
+        name = _name ( node.func )
+        if name in _TEX_CLASSES:
+            strings = [ _string ( arg ) for arg in node.args ]
+            if strings and None not in strings:
+                items.add ( ( name, _TEX_CLASSES [ name ].join ( strings ) ) )
+        if name in _NUMBER_CLASSES:
+            items.update ( ( "MathTex", digit ) for digit in _DIGITS )
+        if name == "Variable":
+            items.add ( ( "MathTex", "=" ) )
+            if len ( node.args ) > 1 and ( label := _string ( node.args [ 1 ] ) ) is not None:
+                items.add ( ( "MathTex", label ) )
+        for keyword in node.keywords:
+            value = _string ( keyword.value )
+            if value is None: continue
+            if keyword.arg == "label": items.add ( ( "MathTex", value ) )
+            elif keyword.arg == "unit" and name in _NUMBER_CLASSES: items.add ( ( "SingleStringMathTex", value ) )
+    return items
+
+def _compile ( item: tuple [ str, str ], tex_dir: str ) -> tuple [ tuple [ str, str ], float, str | None ]:
+    # runs in a worker process; building the mobject runs latex and dvisvgm unless
+    # the svg for this exact tex source already is in `tex_dir`
+    start = time.perf_counter ( )
+    try:
+        import manim
+        manim.config.tex_dir = tex_dir
+        getattr ( manim, item [ 0 ] ) ( item [ 1 ] )
+        error = None
+    except Exception as e:
+        error = f"{type ( e ).__name__}: {e}"
+    return item, time.perf_counter ( ) - start, error
+
+def prewarm ( files: list [ Path ], tex_dir: Path, workers: int | None = None ) -> list [ tuple [ str, str ] ]:
+    # compiles every tex string used by `files` in parallel into manim's tex cache in `tex_dir`,
+    # which is keyed by a hash of the full tex source, so renders pointed at the same directory
+    # find them there instead of compiling them one by one while building the scene
+    items = sorted ( set ( ).union ( *map ( collect_tex, set ( files ) ) ) )
+    if not items: return [ ]
+    Path ( tex_dir ).mkdir ( parents = True, exist_ok = True )
+    workers = min ( workers or os.cpu_count ( ) or 1, len ( items ) )
+    start = time.perf_counter ( )
+    failures = [ ]
+    with ProcessPoolExecutor ( max_workers = workers, mp_context = worker_context ( ) ) as pool:
+        futures = [ pool.submit ( _compile, item, str ( tex_dir ) ) for item in items ]
+        for future in as_completed ( futures ):
+            item, _, error = future.result ( )
+            if error:
+                failures.append ( item )
+                print ( f"could not typeset {item [ 0 ]} {item [ 1 ]!r}: {error}", flush = True )
+    print ( f"typeset {len ( items ) - len ( failures )}/{len ( items )} tex strings "
+            f"in {time.perf_counter ( ) - start:.1f}s on {workers} workers", flush = True )
+    return failures